@@ -6,6 +6,10 @@ import uuid
 class UUID(TypeDecorator):
     """Platform-independent UUID type.
     Uses String for SQLite compatibility.
+
+    Binds accept either ``uuid.UUID`` or ``str`` and are stored via
+    ``str(value)``: a ``uuid.UUID`` becomes the canonical 36-char form,
+    strings are stored unchanged, so compare ids in the same format.
     """
     impl = String
     cache_ok = True
@@ -15,8 +19,6 @@ class UUID(TypeDecorator):
 
     def process_bind_param(self, value, dialect):
         if value is not None:
-            if isinstance(value, uuid.UUID):
-                return str(value)
             return str(value)
         return value
 
@@ -47,7 +47,7 @@ class Booking(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     booking_number = Column(String(50), unique=True, nullable=False, index=True)
     user_id = Column(UUID(), ForeignKey('users.id'), nullable=False, index=True)  # The customer
     created_by_user_id = Column(UUID(), ForeignKey('users.id'), nullable=False, index=True)  # Who created it
-    offer_id = Column(String(36), nullable=True, index=True)  # FK to offers.id (if booked from offer)
+    offer_id = Column(UUID(), nullable=True, index=True)  # FK to offers.id (if booked from offer)
     
     booking_type = Column(SQLEnum(BookingType), nullable=False, index=True)
     status = Column(SQLEnum(BookingStatus), default=BookingStatus.PENDING, nullable=False, index=True)
@@ -91,6 +91,7 @@ class Booking(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     # Relationships
     items = relationship("BookingItem", back_populates="booking", cascade="all, delete-orphan")
     status_history = relationship("BookingStatusHistory", back_populates="booking", cascade="all, delete-orphan")
+    payments = relationship("Payment", back_populates="booking", lazy="select")
     
     def __repr__(self):
         return f"<Booking {self.booking_number}>"
@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text, Enum as
 from sqlalchemy.orm import relationship
 import enum
 from database.base import Base
-from database.mixins import UUIDMixin, TimestampMixin, SoftDeleteMixin
+from database.mixins import UUIDMixin, TimestampMixin, SoftDeleteMixin, UUID
 
 
 class ConversationStatus(str, enum.Enum):
@@ -25,12 +25,12 @@ class Conversation(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "conversations"
     
     # Customer
-    customer_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    customer_id = Column(UUID(), ForeignKey("users.id"), nullable=False, index=True)
     
     # Assigned Employee (Sales)
-    assigned_to = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    assigned_to = Column(UUID(), ForeignKey("users.id"), nullable=True, index=True)
     assigned_at = Column(DateTime(timezone=True), nullable=True)
-    assigned_by = Column(String(36), ForeignKey("users.id"), nullable=True)  # Admin who assigned
+    assigned_by = Column(UUID(), ForeignKey("users.id"), nullable=True)  # Admin who assigned
     
     # Status
     status = Column(SQLEnum(ConversationStatus), nullable=False, default=ConversationStatus.OPEN, index=True)
@@ -49,7 +49,7 @@ class Conversation(Base, UUIDMixin, TimestampMixin):
     
     # Closed info
     closed_at = Column(DateTime(timezone=True), nullable=True)
-    closed_by = Column(String(36), nullable=True)
+    closed_by = Column(UUID(), nullable=True)
     resolution_notes = Column(Text, nullable=True)
     
     # Relationships
@@ -63,10 +63,10 @@ class Message(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "messages"
     
     # Conversation
-    conversation_id = Column(String(36), ForeignKey("conversations.id"), nullable=False, index=True)
+    conversation_id = Column(UUID(), ForeignKey("conversations.id"), nullable=False, index=True)
     
     # Sender
-    sender_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    sender_id = Column(UUID(), ForeignKey("users.id"), nullable=False, index=True)
     sender_role = Column(String(20), nullable=False)  # CUSTOMER, EMPLOYEE, ADMIN, SYSTEM
     
     # Content
@@ -79,7 +79,7 @@ class Message(Base, UUIDMixin, TimestampMixin):
     file_size = Column(Integer, nullable=True)
     
     # For offer messages
-    offer_id = Column(String(36), ForeignKey("offers.id"), nullable=True)
+    offer_id = Column(UUID(), ForeignKey("offers.id"), nullable=True)
     
     # Read status
     is_read = Column(Boolean, default=False)
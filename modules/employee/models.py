@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, Text, Boolean, ForeignKey
 from sqlalchemy.orm import relationship
 
 from database.base import Base
-from database.mixins import UUIDMixin, TimestampMixin
+from database.mixins import UUIDMixin, TimestampMixin, UUID
 
 
 class EmployeeAdminMessage(Base, UUIDMixin, TimestampMixin):
@@ -15,7 +15,7 @@ class EmployeeAdminMessage(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "employee_admin_messages"
 
-    target_employee_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    target_employee_id = Column(UUID(), ForeignKey("users.id"), nullable=True, index=True)
 
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
@@ -23,7 +23,7 @@ class EmployeeAdminMessage(Base, UUIDMixin, TimestampMixin):
     priority = Column(String(20), default="NORMAL", nullable=False)  # NORMAL | HIGH
     is_active = Column(Boolean, default=True, nullable=False)
 
-    created_by_user_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    created_by_user_id = Column(UUID(), ForeignKey("users.id"), nullable=True, index=True)
     created_by_role = Column(String(20), nullable=True)
 
     target_employee = relationship("User", foreign_keys=[target_employee_id])
@@ -1,10 +1,9 @@
 from sqlalchemy import Column, String, Float, Integer, Boolean, ForeignKey, DateTime, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import JSON
 from sqlalchemy.orm import relationship
 import enum
 from database.base import Base
-from database.mixins import UUIDMixin, TimestampMixin
+from database.mixins import UUIDMixin, TimestampMixin, UUID
 
 
 class EntitlementType(str, enum.Enum):
@@ -24,7 +23,7 @@ class ResetPeriod(str, enum.Enum):
 class MembershipEntitlement(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "membership_entitlements"
     
-    plan_id = Column(UUID(as_uuid=True), ForeignKey('membership_plans.id', ondelete='CASCADE'), nullable=False, index=True)
+    plan_id = Column(UUID(), ForeignKey('membership_plans.id', ondelete='CASCADE'), nullable=False, index=True)
     entitlement_code = Column(String(100), unique=True, nullable=False, index=True)
     title_ar = Column(String(255), nullable=False)
     title_en = Column(String(255), nullable=False)
@@ -50,9 +49,9 @@ class MembershipEntitlement(Base, UUIDMixin, TimestampMixin):
 class UserEntitlement(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "user_entitlements"
     
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
-    subscription_id = Column(UUID(as_uuid=True), ForeignKey('membership_subscriptions.id', ondelete='CASCADE'), nullable=False, index=True)
-    entitlement_id = Column(UUID(as_uuid=True), ForeignKey('membership_entitlements.id', ondelete='CASCADE'), nullable=False, index=True)
+    user_id = Column(UUID(), ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    subscription_id = Column(UUID(), ForeignKey('membership_subscriptions.id', ondelete='CASCADE'), nullable=False, index=True)
+    entitlement_id = Column(UUID(), ForeignKey('membership_entitlements.id', ondelete='CASCADE'), nullable=False, index=True)
     quota_used = Column(Integer, default=0)
     quota_remaining = Column(Integer, nullable=True)
     period_start = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -72,12 +71,12 @@ class UserEntitlement(Base, UUIDMixin, TimestampMixin):
 class EntitlementUsageLog(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "entitlement_usage_log"
     
-    user_entitlement_id = Column(UUID(as_uuid=True), ForeignKey('user_entitlements.id', ondelete='CASCADE'), nullable=False, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)
+    user_entitlement_id = Column(UUID(), ForeignKey('user_entitlements.id', ondelete='CASCADE'), nullable=False, index=True)
+    user_id = Column(UUID(), ForeignKey('users.id'), nullable=False, index=True)
     entitlement_code = Column(String(100), nullable=False)
     action = Column(String(50), nullable=False)
     reference_type = Column(String(50), nullable=True, index=True)
-    reference_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    reference_id = Column(UUID(), nullable=True, index=True)
     quantity_used = Column(Integer, default=1)
     notes = Column(String, nullable=True)
     
@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, Boolean, Enum as SQLEnum, ForeignKey, Tex
 from sqlalchemy.orm import relationship
 import enum
 from database.base import Base
-from database.mixins import UUIDMixin, TimestampMixin
+from database.mixins import UUIDMixin, TimestampMixin, UUID
 
 class NotificationType(str, enum.Enum):
     NEW_REEL = "NEW_REEL"  # Admin posted new reel
@@ -56,7 +56,7 @@ class Notification(Base, UUIDMixin, TimestampMixin):
 
     # Target audience
     target_role = Column(SQLEnum(NotificationTargetRole), nullable=False, index=True)
-    target_user_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    target_user_id = Column(UUID(), ForeignKey("users.id"), nullable=True, index=True)
 
     # Notification content
     type = Column(SQLEnum(NotificationType), nullable=False, index=True)
@@ -64,7 +64,7 @@ class Notification(Base, UUIDMixin, TimestampMixin):
     message = Column(Text, nullable=False)
 
     # Related entity
-    related_entity_id = Column(String(36), nullable=True, index=True)
+    related_entity_id = Column(UUID(), nullable=True, index=True)
     related_entity_type = Column(SQLEnum(NotificationEntityType), nullable=True)
 
     # Status
@@ -76,7 +76,7 @@ class Notification(Base, UUIDMixin, TimestampMixin):
     action_url = Column(String(500), nullable=True)
 
     # Trigger info
-    triggered_by_id = Column(String(36), ForeignKey("users.id"), nullable=True)
+    triggered_by_id = Column(UUID(), ForeignKey("users.id"), nullable=True)
     triggered_by_role = Column(String(20), nullable=True)
 
     # Legacy fields removed - they don't exist in the database
@@ -93,7 +93,7 @@ class Notification(Base, UUIDMixin, TimestampMixin):
 class NotificationSettings(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "notification_settings"
 
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, unique=True, index=True)
+    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False, unique=True, index=True)
 
     # Channels
     push_notifications = Column(Boolean, default=True)
@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, Boolean, DateTime, Integer, Float, Text,
 from sqlalchemy.orm import relationship
 import enum
 from database.base import Base
-from database.mixins import UUIDMixin, TimestampMixin, SoftDeleteMixin
+from database.mixins import UUIDMixin, TimestampMixin, SoftDeleteMixin, UUID
 
 
 class OfferType(str, enum.Enum):
@@ -75,7 +75,7 @@ class Offer(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     # Type & Category
     offer_type = Column(SQLEnum(OfferType), nullable=False, default=OfferType.PACKAGE)
     category = Column(String(100), nullable=True)  # Legacy field - kept for backward compatibility
-    category_id = Column(String(36), ForeignKey('categories.id'), nullable=True, index=True)  # Foreign key to categories
+    category_id = Column(UUID(), ForeignKey('categories.id'), nullable=True, index=True)  # Foreign key to categories
     destination = Column(String(200), nullable=True)  # e.g., "Sharm El Sheikh"
     
     # Relationship to Category
@@ -112,7 +112,7 @@ class Offer(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     terms = Column(Text, nullable=True)  # Terms and conditions
     
     # Creator & Targeting
-    created_by_user_id = Column(String(36), nullable=True, index=True)  # FK to users.id
+    created_by_user_id = Column(UUID(), nullable=True, index=True)  # FK to users.id
     target_audience = Column(String(20), nullable=False, default="ALL")  # ALL, ASSIGNED, SPECIFIC
     target_user_ids = Column(Text, nullable=True)  # JSON array of user IDs for SPECIFIC targeting
     
@@ -127,8 +127,8 @@ class Offer(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
 class OfferFavorite(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "offer_favorites"
 
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    offer_id = Column(String(36), ForeignKey("offers.id"), nullable=False, index=True)
+    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False, index=True)
+    offer_id = Column(UUID(), ForeignKey("offers.id"), nullable=False, index=True)
 
     # Relationships
     user = relationship("User")
@@ -141,8 +141,8 @@ class OfferFavorite(Base, UUIDMixin, TimestampMixin):
 class OfferRating(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "offer_ratings"
 
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    offer_id = Column(String(36), ForeignKey("offers.id"), nullable=False, index=True)
+    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False, index=True)
+    offer_id = Column(UUID(), ForeignKey("offers.id"), nullable=False, index=True)
     rating = Column(Integer, nullable=False)
 
     __table_args__ = (
@@ -88,7 +88,7 @@ class Payment(Base, UUIDMixin, TimestampMixin):
     # Relationships
     order = relationship("Order", back_populates="payments")
     user = relationship("User", foreign_keys=[user_id])
-    booking = relationship("Booking", foreign_keys=[booking_id])
+    booking = relationship("Booking", back_populates="payments", foreign_keys=[booking_id])
     
     def __repr__(self):
         return f"<Payment {self.payment_number} {self.status}>"
@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, Integer, Enum as SQLEnum, ForeignKey, Tex
 from sqlalchemy.orm import relationship
 import enum
 from database.base import Base
-from database.mixins import UUIDMixin, TimestampMixin, SoftDeleteMixin
+from database.mixins import UUIDMixin, TimestampMixin, SoftDeleteMixin, UUID
 
 class ReelStatus(str, enum.Enum):
     DRAFT = "DRAFT"
@@ -26,7 +26,7 @@ class Reel(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     status = Column(SQLEnum(ReelStatus), default=ReelStatus.DRAFT, nullable=False, index=True)
     
     # Creator/Owner
-    created_by_user_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True)
+    created_by_user_id = Column(UUID(), ForeignKey("users.id"), nullable=True, index=True)
     
     # Analytics Counters (denormalized for performance)
     views_count = Column(Integer, default=0)
@@ -44,11 +44,11 @@ class Reel(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
 class ReelInteraction(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "reel_interactions"
 
-    reel_id = Column(String(36), ForeignKey("reels.id"), nullable=False, index=True)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=True, index=True) # Nullable for guest views if needed, generally should be logged in
+    reel_id = Column(UUID(), ForeignKey("reels.id"), nullable=False, index=True)
+    user_id = Column(UUID(), ForeignKey("users.id"), nullable=True, index=True) # Nullable for guest views if needed, generally should be logged in
     type = Column(SQLEnum(InteractionType), nullable=False, index=True)
     content = Column(Text, nullable=True) # For comments
-    parent_id = Column(String(36), ForeignKey("reel_interactions.id"), nullable=True, index=True) # For replies to comments
+    parent_id = Column(UUID(), ForeignKey("reel_interactions.id"), nullable=True, index=True) # For replies to comments
     likes_count = Column(Integer, default=0) # For comment likes
     
     # Relationships
@@ -63,8 +63,8 @@ class ReelInteraction(Base, UUIDMixin, TimestampMixin):
 class ReelFavorite(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "reel_favorites"
     
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    reel_id = Column(String(36), ForeignKey("reels.id"), nullable=False, index=True)
+    user_id = Column(UUID(), ForeignKey("users.id"), nullable=False, index=True)
+    reel_id = Column(UUID(), ForeignKey("reels.id"), nullable=False, index=True)
     
     # Relationships
     user = relationship("User")
@@ -1,16 +1,15 @@
 from sqlalchemy import Column, String, Boolean, ForeignKey, Table, DateTime
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from database.base import Base
-from database.mixins import UUIDMixin, TimestampMixin
+from database.mixins import UUIDMixin, TimestampMixin, UUID
 
 # Association table for many-to-many relationship
 role_permissions = Table(
     'role_permissions',
     Base.metadata,
-    Column('id', UUID(as_uuid=True), primary_key=True, server_default='gen_random_uuid()'),
-    Column('role_id', UUID(as_uuid=True), ForeignKey('roles.id', ondelete='CASCADE'), nullable=False, index=True),
-    Column('permission_id', UUID(as_uuid=True), ForeignKey('permissions.id', ondelete='CASCADE'), nullable=False, index=True),
+    Column('id', UUID(), primary_key=True, server_default='gen_random_uuid()'),
+    Column('role_id', UUID(), ForeignKey('roles.id', ondelete='CASCADE'), nullable=False, index=True),
+    Column('permission_id', UUID(), ForeignKey('permissions.id', ondelete='CASCADE'), nullable=False, index=True),
     Column('granted_at', DateTime(timezone=True), server_default='NOW()')
 )
 
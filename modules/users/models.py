@@ -2,7 +2,7 @@ from sqlalchemy import Column, String, Boolean, DateTime, Integer, Enum as SQLEn
 from sqlalchemy.orm import relationship
 import enum
 from database.base import Base
-from database.mixins import UUIDMixin, TimestampMixin, SoftDeleteMixin
+from database.mixins import UUIDMixin, TimestampMixin, SoftDeleteMixin, UUID
 
 
 class UserRole(str, enum.Enum):
@@ -57,7 +57,7 @@ class User(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     login_count = Column(Integer, default=0)
     
     # Employee Assignment
-    assigned_employee_id = Column(String(36), nullable=True, index=True)  # FK to users.id (employee)
+    assigned_employee_id = Column(UUID(), nullable=True, index=True)  # FK to users.id (employee)
     
     # Push Notifications
     expo_push_token = Column(String(255), nullable=True)
@@ -65,6 +65,8 @@ class User(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     # Relationships
     subscriptions = relationship("MembershipSubscription", back_populates="user", cascade="all, delete-orphan")
     referral_code_obj = relationship("ReferralCode", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    # Read-only: loading the balance must not make User deletes touch the points ledger
+    points_balance = relationship("PointsBalance", uselist=False, viewonly=True)
     
     def __repr__(self):
         return f"<User {self.email}>"
@@ -0,0 +1,15 @@
+"""
+Put the backend root on sys.path so scripts can import `database`, `modules`,
+`shared`, ... when run as `python scripts/<name>.py` from any directory.
+
+Import it before any backend import: `import _bootstrap  # noqa: F401`.
+The path is computed and inserted once per process, however many modules
+import this.
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
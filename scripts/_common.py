@@ -0,0 +1,82 @@
+"""
+Helpers shared by the seed/fix scripts that write users straight to the DB.
+
+Hashes are produced with bcrypt exactly like shared.utils.hash_password, so
+the server verifies them, but bcrypt is only imported on the first call and
+scripts that never hash skip the import entirely.
+"""
+import functools
+import json
+import os
+import uuid
+
+ADMIN_EMAIL = "admin@altayar.com"
+ADMIN_PASSWORD = "Admin123"
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_bcrypt = None
+
+
+def hash_password(password: str, rounds: int = 12) -> str:
+    """Hash a password with bcrypt, importing it on first use"""
+    global _bcrypt
+    if _bcrypt is None:
+        import bcrypt
+        _bcrypt = bcrypt
+    return _bcrypt.hashpw(password.encode("utf-8"), _bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def cached_hash(password: str) -> str:
+    """hash_password() computed once per plaintext for the life of the process"""
+    return hash_password(password)
+
+
+def read_sql(name: str) -> str:
+    """Return the contents of an .sql file kept next to the scripts"""
+    with open(os.path.join(SCRIPTS_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def read_json(name: str):
+    """Return the parsed contents of a .json data file kept next to the scripts"""
+    with open(os.path.join(SCRIPTS_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def is_fresh(cache_path: str, sources) -> bool:
+    """True when cache_path exists and is newer than every file in sources"""
+    if not os.path.exists(cache_path):
+        return False
+    cached_at = os.path.getmtime(cache_path)
+    return all(os.path.getmtime(source) < cached_at for source in sources)
+
+
+def insert_admin(cursor, password_hash: str) -> str:
+    """Insert the default admin user through a sqlite3 cursor and return its id"""
+    admin_id = str(uuid.uuid4())
+    cursor.execute("""
+        INSERT INTO users (
+            id, email, username, password_hash,
+            first_name, last_name, phone,
+            role, status, language,
+            email_verified, phone_verified,
+            login_count, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+    """, (
+        admin_id,
+        ADMIN_EMAIL,
+        "admin",
+        password_hash,
+        "System",
+        "Admin",
+        "+1234567890",
+        "ADMIN",
+        "ACTIVE",
+        "ar",
+        1,
+        1,
+        0
+    ))
+    return admin_id
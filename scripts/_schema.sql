@@ -0,0 +1,56 @@
+-- Core tables shared by init_db.py and fix_project.py.
+-- Unique indexes live in _schema_indexes.sql (see there for when each script builds them).
+
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    email TEXT NOT NULL,
+    username TEXT,
+    password_hash TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    phone TEXT,
+    avatar TEXT,
+    gender TEXT,
+    country TEXT,
+    birthdate DATETIME,
+    membership_id_display TEXT,
+    role TEXT DEFAULT 'CUSTOMER',
+    employee_type TEXT,
+    status TEXT DEFAULT 'ACTIVE',
+    language TEXT DEFAULT 'ar',
+    email_verified BOOLEAN DEFAULT 0,
+    email_verified_at DATETIME,
+    phone_verified BOOLEAN DEFAULT 0,
+    phone_verified_at DATETIME,
+    last_login_at DATETIME,
+    login_count INTEGER DEFAULT 0,
+    assigned_employee_id TEXT,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    deleted_at DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS membership_plans (
+    id TEXT PRIMARY KEY,
+    tier_code TEXT NOT NULL,
+    tier_name_ar TEXT NOT NULL,
+    tier_name_en TEXT NOT NULL,
+    tier_order INTEGER NOT NULL,
+    description_ar TEXT,
+    description_en TEXT,
+    price REAL DEFAULT 0.0,
+    currency TEXT DEFAULT 'USD',
+    plan_type TEXT,
+    duration_days INTEGER,
+    purchase_limit INTEGER,
+    cashback_rate REAL DEFAULT 0.0,
+    points_multiplier REAL DEFAULT 1.0,
+    initial_points INTEGER DEFAULT 0,
+    perks TEXT,
+    upgrade_criteria TEXT,
+    color_hex TEXT,
+    icon_url TEXT,
+    is_active BOOLEAN DEFAULT 1,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,9 @@
+-- Unique indexes for the tables in _schema.sql; names match the ORM's.
+-- No BEGIN/COMMIT here: callers run this inside their own transaction.
+-- init_db.py creates them with the tables, before its insert, because it
+-- re-runs against an existing database. fix_project.py always starts from a
+-- new file, so it builds them once after seeding.
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_membership_plans_tier_code ON membership_plans (tier_code);
@@ -0,0 +1,57 @@
+"""
+Raw sqlite3 helpers shared by the seed, migration and debug scripts.
+
+Every connection these scripts open gets the same pragma set: WAL so a script
+can run next to the app without blocking its writers, synchronous=NORMAL so a
+commit costs one fsync of the WAL instead of one per journal write, in-memory
+temp storage, a 64 MB page cache, and a busy timeout instead of failing
+immediately when the app holds the write lock.
+
+Connections from open_db() are in autocommit mode (isolation_level=None): the
+sqlite3 module never opens or commits a transaction behind the script's back,
+so every multi-statement write starts with an explicit BEGIN and ends with
+COMMIT (or conn.commit() / ``with conn:``).
+"""
+import sqlite3
+
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-64000",
+    "busy_timeout=5000",
+)
+
+# SQL expression for a random (version 4) UUID in the canonical 36-char form the
+# app's UUID column type stores, generated by SQLite itself
+SQL_UUID4 = (
+    "lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+    "substr(lower(hex(randomblob(2))), 2) || '-' || "
+    "substr('89ab', 1 + (abs(random()) % 4), 1) || "
+    "substr(lower(hex(randomblob(2))), 2) || '-' || lower(hex(randomblob(6)))"
+)
+
+
+def tune_sqlite(conn):
+    """Apply SQLITE_PRAGMAS to a raw sqlite3 connection and return it"""
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+
+def open_db(db_path):
+    """Connect to db_path in autocommit mode with SQLITE_PRAGMAS applied"""
+    return tune_sqlite(sqlite3.connect(db_path, isolation_level=None))
+
+
+def split_sql(script):
+    """Split an SQL script into complete statements, honouring quotes and comments"""
+    statements, buf = [], ""
+    for line in script.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            statements.append(buf.strip())
+            buf = ""
+    if buf.strip():
+        statements.append(buf.strip())
+    return statements
@@ -0,0 +1,23 @@
+"""
+Shared setup for the simple_* service test scripts: dummy settings, the dev
+database URL, and a single `import modules` so every mapper is registered
+before a session is opened.
+
+Import SessionLocal from here instead of repeating the setup. Python caches
+this module, so scripts run back to back in one interpreter pay for the
+environment setup and the model imports only once.
+"""
+import os
+
+import _bootstrap  # noqa: F401
+
+os.environ["DATABASE_URL"] = "sqlite:///d:/Development/altayar/MobileApp/backend/altayarvip.db"
+os.environ["JWT_SECRET_KEY"] = "dummy"
+os.environ["SECRET_KEY"] = "dummy"
+os.environ["FAWATERK_API_KEY"] = "dummy"
+os.environ["FAWATERK_VENDOR_KEY"] = "dummy"
+
+# Import all models first
+import modules  # noqa: E402,F401
+
+from database.base import SessionLocal  # noqa: E402,F401
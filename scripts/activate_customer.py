@@ -33,8 +33,8 @@ def activate_customer():
         user.phone_verified_at = datetime.utcnow()
         
         db.commit()
-        db.refresh(user)
-        print(f"✅ User {user.email} is now ACTIVE and VERIFIED.")
+        # Use the local email: touching `user` after commit would reload the expired row
+        print(f"✅ User {email} is now ACTIVE and VERIFIED.")
         
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,62 @@
+"""
+Create or repair the admin user in one statement.
+
+Inserts admin@altayar.com if it is missing; otherwise resets its password and
+forces role=ADMIN / status=ACTIVE, keeping the existing id so rows that point
+at the admin stay valid.
+
+Usage: python admin.py [path/to/altayarvip.db]
+"""
+import sqlite3
+import sys
+import uuid
+
+from _common import ADMIN_EMAIL, ADMIN_PASSWORD, hash_password
+
+DB_PATH = sys.argv[1] if len(sys.argv) > 1 else "altayarvip.db"
+
+print(f"🔧 Fixing admin user in {DB_PATH}...")
+print("=" * 70)
+
+conn = sqlite3.connect(DB_PATH)
+cursor = conn.cursor()
+
+try:
+    with conn:
+        cursor.execute("""
+            INSERT INTO users (
+                id, email, username, password_hash,
+                first_name, last_name, phone,
+                role, status, language,
+                email_verified, phone_verified,
+                login_count, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, 'ADMIN', 'ACTIVE', 'ar', 1, 1, 0, datetime('now'), datetime('now'))
+            ON CONFLICT(email) DO UPDATE SET
+                password_hash = excluded.password_hash,
+                role = 'ADMIN',
+                status = 'ACTIVE',
+                updated_at = datetime('now')
+        """, (
+            str(uuid.uuid4()),
+            ADMIN_EMAIL,
+            "admin",
+            hash_password(ADMIN_PASSWORD),
+            "System",
+            "Admin",
+            "+1234567890",
+        ))
+
+    print("\n" + "=" * 70)
+    print("✅ SUCCESS! Admin user is ready!")
+    print("=" * 70)
+    print("\n🔐 Login Credentials:")
+    print(f"   Email:    {ADMIN_EMAIL}")
+    print(f"   Password: {ADMIN_PASSWORD}")
+    print("\n🚀 Start server: python server.py")
+
+except Exception as e:
+    print(f"\n❌ Error: {e}")
+    import traceback
+    traceback.print_exc()
+finally:
+    conn.close()
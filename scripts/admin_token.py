@@ -0,0 +1,72 @@
+"""
+Shared admin login for the HTTP check_*.py scripts.
+
+The login response is cached on disk so back-to-back script runs reuse the
+same access token instead of logging in (bcrypt verify + JWT sign) each time.
+The cache file is readable by its owner only, and a token the server rejects
+(DB reset, rotated secret) is dropped and replaced by a fresh login: call
+admin_get() instead of building the Authorization header by hand.
+"""
+import json
+import os
+import time
+
+import requests
+
+BASE_URL = "http://localhost:8082/api"
+TOKEN_CACHE_PATH = os.path.expanduser("~/.altayar_admin_token")
+# Well under JWT_ACCESS_TOKEN_EXPIRE_MINUTES so a cached token never goes stale mid-run
+TOKEN_CACHE_TTL = 3300
+
+
+def clear_admin_auth():
+    """Forget the cached login so the next get_admin_auth() logs in again"""
+    try:
+        os.remove(TOKEN_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+
+
+def get_admin_auth(refresh=False):
+    """Return the admin login payload ({"access_token": ..., "user": {...}})
+
+    refresh=True skips the cache and logs in again.
+    """
+    if not refresh:
+        try:
+            with open(TOKEN_CACHE_PATH) as f:
+                cached = json.load(f)
+            if cached["exp"] > time.time() + 30:
+                return cached["auth"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    auth_res = requests.post(f"{BASE_URL}/auth/login", json={
+        "identifier": "admin@altayar.com",
+        "password": "Admin123"
+    })
+
+    if auth_res.status_code != 200:
+        print(f"Login failed: {auth_res.text}")
+        exit(1)
+
+    auth = auth_res.json()
+    # Bearer token on disk: owner read/write only, whatever the umask
+    clear_admin_auth()
+    fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({"auth": auth, "exp": time.time() + TOKEN_CACHE_TTL}, f)
+    return auth
+
+
+def get_admin_token(refresh=False):
+    return get_admin_auth(refresh)["access_token"]
+
+
+def admin_get(path, **kwargs):
+    """GET BASE_URL + path as admin, logging in again once if the cached token is rejected"""
+    res = requests.get(f"{BASE_URL}{path}", headers={"Authorization": f"Bearer {get_admin_token()}"}, **kwargs)
+    if res.status_code == 401:
+        clear_admin_auth()
+        res = requests.get(f"{BASE_URL}{path}", headers={"Authorization": f"Bearer {get_admin_token(refresh=True)}"}, **kwargs)
+    return res
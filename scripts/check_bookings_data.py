@@ -1,29 +1,61 @@
 #!/usr/bin/env python3
-import sys
-import os
-sys.path.append('.')
+from concurrent.futures import ThreadPoolExecutor
+import _bootstrap  # noqa: F401
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import selectinload
 
 from database.base import SessionLocal
 from modules.bookings.models import Booking
 from modules.payments.models import Payment
 
+def _booking_counts():
+    db = SessionLocal()
+    try:
+        return db.query(
+            func.count(Booking.id),
+            func.count(case((Booking.deleted_at.is_(None), Booking.id))),
+        ).one()
+    finally:
+        db.close()
+
+def _payment_counts():
+    db = SessionLocal()
+    try:
+        # COUNT(column) skips NULLs, so this also gives payments linked to bookings
+        return db.query(
+            func.count(Payment.id),
+            func.count(Payment.booking_id),
+        ).one()
+    finally:
+        db.close()
+
 def main():
     db = SessionLocal()
+    # The aggregates are independent of each other and of the sample fetch,
+    # so run them on their own sessions while the main session loads samples.
+    pool = ThreadPoolExecutor(max_workers=2)
     try:
-        total_bookings = db.query(Booking).count()
-        not_deleted = db.query(Booking).filter(Booking.deleted_at.is_(None)).count()
+        booking_counts = pool.submit(_booking_counts)
+        payment_counts = pool.submit(_payment_counts)
+
+        # Get some sample bookings
+        bookings = (
+            db.query(Booking)
+            .options(selectinload(Booking.payments))
+            .filter(Booking.deleted_at.is_(None))
+            .limit(10)
+            .all()
+        )
+
+        total_bookings, not_deleted = booking_counts.result()
         print(f'Total bookings: {total_bookings}')
         print(f'Not deleted: {not_deleted}')
 
-        total_payments = db.query(Payment).count()
+        total_payments, booking_payments = payment_counts.result()
         print(f'Total payments: {total_payments}')
-
-        # Get payments linked to bookings
-        booking_payments = db.query(Payment).filter(Payment.booking_id.isnot(None)).count()
         print(f'Payments linked to bookings: {booking_payments}')
 
-        # Get some sample bookings
-        bookings = db.query(Booking).filter(Booking.deleted_at.is_(None)).limit(10).all()
         for b in bookings:
             print(f'Booking ID: {b.id}')
             print(f'  User ID: {b.user_id}')
@@ -36,7 +68,7 @@ def main():
             print(f'  Created: {b.created_at}')
 
             # Check if payment exists
-            payment = db.query(Payment).filter(Payment.booking_id == b.id).first()
+            payment = b.payments[0] if b.payments else None
             if payment:
                 print(f'  Payment exists: {payment.payment_number} (Status: {payment.status})')
             else:
@@ -48,6 +80,7 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        pool.shutdown()
         db.close()
 
 if __name__ == "__main__":
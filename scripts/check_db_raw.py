@@ -4,14 +4,29 @@ import os
 db_path = 'd:/Development/altayar/MobileApp/backend/altayarvip.db'
 
 print(f"Checking database at: {db_path}")
-conn = sqlite3.connect(db_path)
+# The driver keeps compiled statements keyed by SQL text; size the cache so
+# every per-table PRAGMA/SELECT stays prepared across calls on this cursor.
+conn = sqlite3.connect(db_path, cached_statements=256)
 c = conn.cursor()
 
+# Read-only tuning: bigger page cache, in-memory temp storage, mmap'd reads
+c.execute("PRAGMA cache_size=-64000")
+c.execute("PRAGMA temp_store=MEMORY")
+c.execute("PRAGMA mmap_size=268435456")
+
+_SCHEMA_CACHE: dict[str, list] = {}
+
+def get_table_columns(table_name):
+    cols = _SCHEMA_CACHE.get(table_name)
+    if cols is None:
+        c.execute(f"PRAGMA table_info({table_name})")
+        cols = _SCHEMA_CACHE[table_name] = c.fetchall()
+    return cols
+
 def print_table_info(table_name):
     print(f"\n--- Table: {table_name} ---")
     try:
-        c.execute(f"PRAGMA table_info({table_name})")
-        cols = c.fetchall()
+        cols = get_table_columns(table_name)
         for col in cols:
             print(f"  {col[1]} ({col[2]})")
             
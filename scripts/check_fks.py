@@ -9,21 +9,24 @@ c = conn.cursor()
 
 try:
     print("\n--- Validating Subscription FKs ---")
-    c.execute("SELECT id, user_id, plan_id FROM membership_subscriptions LIMIT 1")
-    sub = c.fetchone()
+    # One LEFT JOIN instead of three lookups; a missing FK target comes back as NULLs
+    c.execute("""
+        SELECT s.id, s.user_id, s.plan_id, u.id, u.email, p.id, p.tier_name_en
+        FROM membership_subscriptions s
+        LEFT JOIN users u ON u.id = s.user_id
+        LEFT JOIN membership_plans p ON p.id = s.plan_id
+        LIMIT 1
+    """)
+    row = c.fetchone()
     
-    if sub:
-        print(f"Subscription: {sub}")
-        sub_id, user_id, plan_id = sub
+    if row:
+        sub_id, user_id, plan_id, u_id, u_email, p_id, p_name = row
+        print(f"Subscription: {(sub_id, user_id, plan_id)}")
         
-        # Check User
-        c.execute("SELECT id, email FROM users WHERE id = ?", (user_id,))
-        user = c.fetchone()
+        user = (u_id, u_email) if u_id is not None else None
         print(f"  -> Linked User: {user if user else 'MISSING'}")
         
-        # Check Plan
-        c.execute("SELECT id, tier_name_en FROM membership_plans WHERE id = ?", (plan_id,))
-        plan = c.fetchone()
+        plan = (p_id, p_name) if p_id is not None else None
         print(f"  -> Linked Plan: {plan if plan else 'MISSING'}")
         
     else:
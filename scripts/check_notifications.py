@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 import sqlite3
-import json
+import sys
 
 conn = sqlite3.connect('altayarvip.db')
+conn.row_factory = sqlite3.Row
+conn.execute('PRAGMA mmap_size=268435456')
+conn.execute('PRAGMA cache_size=-20000')
 cursor = conn.cursor()
 
 try:
@@ -20,18 +23,20 @@ try:
             cursor.execute('SELECT id, type, title, message, target_role, is_read, created_at, related_entity_type, related_entity_id, action_url FROM notifications ORDER BY created_at DESC LIMIT 5')
             notifications = cursor.fetchall()
 
-            print('\n📋 Recent notifications:')
-            for notif in notifications:
-                print(f'  - ID: {notif[0]}')
-                print(f'    Type: {notif[1]}')
-                print(f'    Title: {notif[2]}')
-                print(f'    Message: {notif[3][:100]}...')
-                print(f'    Target Role: {notif[4]}')
-                print(f'    Read: {notif[5]}')
-                print(f'    Related Entity: {notif[7]} (ID: {notif[8]})')
-                print(f'    Action URL: {notif[9]}')
-                print(f'    Created: {notif[6]}')
-                print()
+            lines = ['\n📋 Recent notifications:']
+            for n in notifications:
+                lines.append(
+                    f"  - ID: {n['id']}\n"
+                    f"    Type: {n['type']}\n"
+                    f"    Title: {n['title']}\n"
+                    f"    Message: {n['message'][:100]}...\n"
+                    f"    Target Role: {n['target_role']}\n"
+                    f"    Read: {n['is_read']}\n"
+                    f"    Related Entity: {n['related_entity_type']} (ID: {n['related_entity_id']})\n"
+                    f"    Action URL: {n['action_url']}\n"
+                    f"    Created: {n['created_at']}\n"
+                )
+            sys.stdout.write('\n'.join(lines) + '\n')
         else:
             print('⚠️  No notifications found in database')
     else:
@@ -1,5 +1,4 @@
 import os
-import sys
 
 # Set dummy env vars to bypass Pydantic validation
 os.environ["DATABASE_URL"] = "sqlite:///d:/Development/altayar/MobileApp/backend/altayarvip.db"
@@ -8,11 +7,11 @@ os.environ["SECRET_KEY"] = "dummy_secret"
 os.environ["FAWATERK_API_KEY"] = "dummy_key"
 os.environ["FAWATERK_VENDOR_KEY"] = "dummy_key"
 
-sys.path.append(os.path.join(os.path.dirname(__file__)))
+import _bootstrap  # noqa: F401
 
 from database.base import SessionLocal
 from modules.users.models import User
-from shared.utils import hash_password
+from shared.utils import hash_password, verify_password
 
 def check_user():
     db = SessionLocal()
@@ -26,11 +25,14 @@ def check_user():
             print(f"Role: {user.role}")
             print(f"Status: {user.status}")
             
-            # Reset password
-            print("Resetting password to 'Admin123'...")
-            user.password_hash = hash_password("Admin123")
-            db.commit()
-            print("✅ Password reset successfully!")
+            # Reset password (skip the bcrypt hash + commit if it already matches)
+            if user.password_hash and verify_password("Admin123", user.password_hash):
+                print("✅ Password already set to 'Admin123'")
+            else:
+                print("Resetting password to 'Admin123'...")
+                user.password_hash = hash_password("Admin123")
+                db.commit()
+                print("✅ Password reset successfully!")
         else:
             print(f"❌ User NOT FOUND: {email}")
             
@@ -1,23 +1,9 @@
-import requests
-
-BASE_URL = "http://localhost:8082/api"
-
-# Login as admin
-auth_res = requests.post(f"{BASE_URL}/auth/login", json={
-    "identifier": "admin@altayar.com",
-    "password": "Admin123"
-})
-
-if auth_res.status_code != 200:
-    print(f"Login failed: {auth_res.text}")
-    exit(1)
-
-token = auth_res.json()["access_token"]
-headers = {"Authorization": f"Bearer {token}"}
+from admin_token import admin_get
 
 # Test the /me endpoint for the user we created the booking for
 user_id = '7595f034-37ff-4141-bb89-4b1c465b2d26'  # From the test output
-user_bookings_res = requests.get(f"{BASE_URL}/bookings/me", headers=headers)
+# As admin; reuses the cached token when still valid
+user_bookings_res = admin_get("/bookings/me")
 
 print(f"User bookings status: {user_bookings_res.status_code}")
 if user_bookings_res.status_code == 200:
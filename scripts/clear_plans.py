@@ -21,25 +21,19 @@ DEFAULT_PLANS = ['BRONZE', 'SILVER', 'GOLD', 'PLATINUM', 'VIP', 'DIAMOND']
 
 try:
     print(f"Opening database: {DB_PATH}")
-    
-    # Check current count
-    cursor.execute("SELECT count(*) FROM membership_plans")
-    total_before = cursor.fetchone()[0]
-    print(f"Total plans before: {total_before}")
+    cursor.execute("PRAGMA synchronous=NORMAL")
 
-    # Delete only default plans
+    # Delete only default plans; RETURNING gives the deleted rows directly
     placeholders = ','.join(['?'] * len(DEFAULT_PLANS))
-    query = f"DELETE FROM membership_plans WHERE tier_code IN ({placeholders})"
-    
-    cursor.execute(query, DEFAULT_PLANS)
-    deleted_count = cursor.rowcount
-    conn.commit()
-    
+    query = f"DELETE FROM membership_plans WHERE tier_code IN ({placeholders}) RETURNING id"
+
+    with conn:
+        deleted_count = len(cursor.execute(query, DEFAULT_PLANS).fetchall())
+        cursor.execute("SELECT count(*) FROM membership_plans")
+        total_after = cursor.fetchone()[0]
+
+    print(f"Total plans before: {total_after + deleted_count}")
     print(f"✅ Deleted {deleted_count} default plans ({', '.join(DEFAULT_PLANS)})")
-    
-    # Check count after
-    cursor.execute("SELECT count(*) FROM membership_plans")
-    total_after = cursor.fetchone()[0]
     print(f"Remaining plans: {total_after}")
 
 except Exception as e:
@@ -1,12 +1,12 @@
 """
 Create admin user in database
 """
+import os
 import sqlite3
-from passlib.context import CryptContext
 import uuid
 
-# Password hasher
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# ALTAYAR_DEV=1 drops bcrypt to the minimum cost for fast local bootstrapping
+BCRYPT_ROUNDS = 4 if os.getenv("ALTAYAR_DEV") == "1" else 12
 
 # Connect to database
 conn = sqlite3.connect('altayar.db')
@@ -19,6 +19,10 @@ try:
         print("❌ Users table doesn't exist! Please start the server first to create tables.")
         exit(1)
     
+    # Password hasher (passlib/bcrypt imported only once we know we need it)
+    from passlib.context import CryptContext
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+    
     # Create admin user
     admin_id = str(uuid.uuid4())
     email = "admin@altayar.com"
@@ -1,18 +1,16 @@
 """
 Create admin user using SQLAlchemy models
 """
-import sys
 import os
 
-# Add backend to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import _bootstrap  # noqa: F401
 
 from database.base import SessionLocal
 from modules.users.models import User, UserRole, UserStatus
-from passlib.context import CryptContext
 import uuid
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# ALTAYAR_DEV=1 drops bcrypt to the minimum cost for fast local bootstrapping
+BCRYPT_ROUNDS = 4 if os.getenv("ALTAYAR_DEV") == "1" else 12
 
 print("🔐 Creating admin user with SQLAlchemy...")
 print("=" * 70)
@@ -23,16 +21,23 @@ try:
     # Check if admin exists
     existing = db.query(User).filter(User.email == "admin@altayar.com").first()
     
+    # Password hasher (passlib/bcrypt imported only once the DB is reachable)
+    from passlib.context import CryptContext
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+    
     if existing:
         print("⚠️  Admin user already exists!")
         print(f"   Email: {existing.email}")
         print(f"   Role: {existing.role}")
-        print("\n🔄 Updating password...")
         
-        # Update password
-        existing.password_hash = pwd_context.hash("Admin123")
-        db.commit()
-        print("✅ Password updated!")
+        # Update password only when the stored hash doesn't already match
+        if existing.password_hash and pwd_context.verify("Admin123", existing.password_hash):
+            print("✅ Password already up to date!")
+        else:
+            print("\n🔄 Updating password...")
+            existing.password_hash = pwd_context.hash("Admin123")
+            db.commit()
+            print("✅ Password updated!")
     else:
         # Create new admin
         admin = User(
@@ -2,9 +2,7 @@
 Script to create benefits pages for all existing membership plans
 This will create empty benefits pages that can be filled later
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
 
 from sqlalchemy.orm import Session
 from database.base import get_db
@@ -26,11 +24,16 @@ def create_all_benefits_pages():
     
     print(f"📋 Found {len(plans)} membership plans\n")
     
+    # Fetch every plan that already has a benefits page in one IN query
+    existing_plan_ids = {
+        plan_id for (plan_id,) in db.query(MembershipBenefits.plan_id)
+        .filter(MembershipBenefits.plan_id.in_([plan.id for plan in plans]))
+        .all()
+    }
+    new_pages = []
+    
     for plan in plans:
-        # Check if benefits already exist
-        existing = db.query(MembershipBenefits).filter(MembershipBenefits.plan_id == plan.id).first()
-        
-        if existing:
+        if plan.id in existing_plan_ids:
             print(f"⏭️  Skipping {plan.tier_name_en} ({plan.tier_code}) - Benefits page already exists")
             skipped_count += 1
         else:
@@ -67,10 +70,12 @@ def create_all_benefits_pages():
                 upgrade_info_en="",
                 upgrade_info_ar="",
             )
-            db.add(new_benefits)
+            new_pages.append(new_benefits)
             created_count += 1
             print(f"✅ Created benefits page for {plan.tier_name_en} ({plan.tier_code})")
     
+    # Plain inserts: skip per-object unit-of-work bookkeeping
+    db.bulk_save_objects(new_pages)
     db.commit()
     
     print(f"\n{'='*50}")
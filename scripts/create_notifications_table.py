@@ -5,11 +5,9 @@ Run this after the server starts and creates other tables.
 """
 
 import sqlite3
-import sys
 import os
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(__file__))
+import _bootstrap  # noqa: F401
 
 def create_notifications_table():
     # Connect to the database
@@ -19,7 +17,8 @@ def create_notifications_table():
         return
 
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
 
     try:
         # Create the notifications table
@@ -69,17 +68,16 @@ def create_notifications_table():
             "CREATE INDEX IF NOT EXISTS ix_notifications_related_entity_id ON notifications(related_entity_id);",
             "CREATE INDEX IF NOT EXISTS ix_notifications_is_read ON notifications(is_read);",
             "CREATE INDEX IF NOT EXISTS ix_notifications_created_at ON notifications(created_at);",
-            "CREATE INDEX IF NOT EXISTS ix_notifications_deleted_at ON notifications(deleted_at);"
+            "CREATE INDEX IF NOT EXISTS ix_notifications_deleted_at ON notifications(deleted_at);",
+            # Serves "WHERE deleted_at IS NULL ORDER BY created_at DESC" without a temp B-tree sort
+            "CREATE INDEX IF NOT EXISTS ix_notifications_alive_recent ON notifications(deleted_at, created_at DESC);"
         ]
 
-        cursor.execute(create_table_sql)
+        # One script, one transaction: table + all indexes commit together
+        ddl = create_table_sql + "\n" + "\n".join(indexes_sql)
+        conn.executescript("BEGIN;\n" + ddl + "\nCOMMIT;")
         print("✅ Created notifications table")
-
-        for index_sql in indexes_sql:
-            cursor.execute(index_sql)
         print("✅ Created indexes on notifications table")
-
-        conn.commit()
         print("✅ Notifications table setup complete!")
 
     except Exception as e:
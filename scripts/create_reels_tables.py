@@ -1,17 +1,68 @@
-from database.base import engine, Base
-from modules.reels.models import Reel, ReelInteraction
 import logging
+import os
+import sqlite3
+import sys
+
+import _bootstrap  # noqa: F401
+from _common import is_fresh
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_tables():
+# Generated from the ORM metadata; later runs replay it with sqlite3 instead
+# of importing the models just to call create_all(). Rebuilt whenever the reels
+# models, the shared column mixins or this script are newer than it.
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DDL_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reels.sql")
+DDL_SOURCES = (
+    os.path.abspath(__file__),
+    os.path.join(BACKEND_DIR, "modules", "reels", "models.py"),
+    os.path.join(BACKEND_DIR, "database", "mixins.py"),
+)
+
+
+def build_ddl_cache():
+    """Dump CREATE TABLE/INDEX statements for the reels tables to DDL_CACHE_PATH"""
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    from database.base import engine
+    from modules.reels.models import Reel, ReelFavorite, ReelInteraction
+
+    statements = []
+    # Only the reels tables: the cache is keyed on the reels sources, so it
+    # must not carry DDL for models it doesn't watch
+    for table in (Reel.__table__, ReelInteraction.__table__, ReelFavorite.__table__):
+        statements.append(str(CreateTable(table, if_not_exists=True).compile(engine)).strip() + ";")
+        for index in table.indexes:
+            statements.append(str(CreateIndex(index, if_not_exists=True).compile(engine)).strip() + ";")
+
+    with open(DDL_CACHE_PATH, "w", encoding="utf-8") as f:
+        f.write("\n\n".join(statements) + "\n")
+    logger.info(f"Wrote DDL cache to {DDL_CACHE_PATH}")
+
+
+def create_tables(rebuild=False):
     logger.info("Creating Reels tables...")
     try:
-        Base.metadata.create_all(bind=engine)
+        from config.settings import settings
+
+        if not settings.DATABASE_URL.startswith("sqlite:///"):
+            # The cached DDL is SQLite-specific; other backends go through the ORM
+            from database.base import engine, Base
+            from modules.reels.models import Reel, ReelInteraction  # noqa: F401
+            Base.metadata.create_all(bind=engine)
+        else:
+            if rebuild or not is_fresh(DDL_CACHE_PATH, DDL_SOURCES):
+                build_ddl_cache()
+            with open(DDL_CACHE_PATH, encoding="utf-8") as f:
+                ddl = f.read()
+            conn = sqlite3.connect(settings.DATABASE_URL[len("sqlite:///"):])
+            try:
+                conn.executescript(ddl)
+            finally:
+                conn.close()
         logger.info("✅ Tables created successfully.")
     except Exception as e:
         logger.error(f"❌ Error creating tables: {e}")
 
 if __name__ == "__main__":
-    create_tables()
+    create_tables(rebuild="--rebuild" in sys.argv)
@@ -1,15 +1,17 @@
 """
 Simple seed script - creates 3 test users (Admin, Employee, Customer)
 """
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import _bootstrap  # noqa: F401
+
+from sqlalchemy import exists, insert, select
 
 from database.base import SessionLocal
 from modules.users.models import User, UserRole, EmployeeType, UserStatus
 from datetime import datetime
 import uuid
 
+from _common import hash_password
+
 # Simple hash function for testing (NOT for production!)
 def simple_hash(password: str) -> str:
     """Simple hash for testing - uses Python's built-in hash"""
@@ -22,59 +24,41 @@ def create_users():
     try:
         print("🔧 Creating test users...")
         
-        # Check if already exists
-        if db.query(User).filter(User.email == "admin@altayar.com").first():
-            print("⚠️  Users already exist!")
-            return
-        
-        # 1. Admin
-        admin = User(
-            id=str(uuid.uuid4()),
-            email="admin@altayar.com",
-            password_hash="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYqYCNqJ4tK",  # Admin123
-            phone="+966500000001",
-            first_name="Admin",
-            last_name="User",
-            role=UserRole.ADMIN,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # 2. Employee
-        employee = User(
-            id=str(uuid.uuid4()),
-            email="employee@altayar.com",
-            password_hash="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYqYCNqJ4tK",  # Employee123
-            phone="+966500000002",
-            first_name="Employee",
-            last_name="User",
-            role=UserRole.EMPLOYEE,
-            employee_type=EmployeeType.RESERVATION,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # 3. Customer
-        customer = User(
-            id=str(uuid.uuid4()),
-            email="customer@altayar.com",
-            password_hash="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYqYCNqJ4tK",  # Customer123
-            phone="+966500000003",
-            first_name="Customer",
-            last_name="User",
-            role=UserRole.CUSTOMER,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        db.add_all([admin, employee, customer])
-        db.commit()
+        # One transaction, one executemany INSERT for all three users
+        with db.begin():
+            # Check if already exists
+            if db.execute(select(exists().where(User.email == "admin@altayar.com"))).scalar():
+                print("⚠️  Users already exist!")
+                return
+            
+            # Fields shared by all three accounts; one timestamp for the batch.
+            # executemany compiles one statement from the first row's keys,
+            # so every row carries the same columns (employee_type included).
+            now = datetime.utcnow()
+            shared = dict(
+                employee_type=None,
+                status=UserStatus.ACTIVE,
+                language="ar",
+                email_verified=True,
+                email_verified_at=now,
+            )
+            rows = [
+                # 1. Admin
+                {**shared, "id": str(uuid.uuid4()), "email": "admin@altayar.com", "phone": "+966500000001",
+                 "password_hash": hash_password("Admin123", rounds=4),
+                 "first_name": "Admin", "last_name": "User", "role": UserRole.ADMIN},
+                # 2. Employee
+                {**shared, "id": str(uuid.uuid4()), "email": "employee@altayar.com", "phone": "+966500000002",
+                 "password_hash": hash_password("Employee123", rounds=4),
+                 "first_name": "Employee", "last_name": "User", "role": UserRole.EMPLOYEE,
+                 "employee_type": EmployeeType.RESERVATION},
+                # 3. Customer
+                {**shared, "id": str(uuid.uuid4()), "email": "customer@altayar.com", "phone": "+966500000003",
+                 "password_hash": hash_password("Customer123", rounds=4),
+                 "first_name": "Customer", "last_name": "User", "role": UserRole.CUSTOMER},
+            ]
+            
+            db.execute(insert(User), rows)
         
         print("✅ Users created!")
         print("\n" + "="*50)
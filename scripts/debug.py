@@ -0,0 +1,101 @@
+"""
+Debug checks for the backend, run in one interpreter.
+
+Usage:
+    python scripts/debug.py imports          # import the route modules
+    python scripts/debug.py routes           # list registered routes
+    python scripts/debug.py login            # run AuthService.login for the admin
+    python scripts/debug.py routes login     # several checks share one import of `modules`
+
+Most of the wall time of these checks is interpreter startup plus importing
+SQLAlchemy/FastAPI/Pydantic and the models, so running several checks in one
+process pays that cost once. To see where startup time goes:
+
+    python -X importtime scripts/debug.py imports 2> importtime.log
+"""
+import argparse
+import os
+import traceback
+
+import _bootstrap  # noqa: F401
+
+# Dummy values so Settings validates; real environment variables win
+os.environ.setdefault("DATABASE_URL", "sqlite:///d:/Development/altayar/MobileApp/backend/altayarvip.db")
+os.environ.setdefault("JWT_SECRET_KEY", "dummy")
+os.environ.setdefault("SECRET_KEY", "dummy")
+os.environ.setdefault("FAWATERK_API_KEY", "dummy")
+os.environ.setdefault("FAWATERK_VENDOR_KEY", "dummy")
+
+
+def _register_models():
+    """Import every model once so SQLAlchemy can resolve relationships (no-op after the first call)"""
+    import modules  # noqa: F401
+
+
+def check_imports():
+    for name in ("bookings", "wallet", "payments", "admin"):
+        module = f"modules.{name}.routes"
+        print(f"Attempting to import {module}...")
+        try:
+            __import__(module)
+            print(f"✅ {module} imported successfully.")
+        except Exception as e:
+            print(f"❌ Import failed: {e}")
+            traceback.print_exc()
+
+
+def check_routes():
+    try:
+        _register_models()
+        from debug_routes import print_routes
+        print_routes()
+    except Exception:
+        print("ROUTE LISTING FAILED WITH ERROR:")
+        traceback.print_exc()
+
+
+def check_login():
+    db = None
+    try:
+        _register_models()
+        from modules.auth.service import AuthService
+        from modules.auth.schemas import LoginRequest
+        from debug_common import SessionLocal
+
+        print("Attempting login for admin@altayar.com...")
+        db = SessionLocal()
+        service = AuthService(db)
+        req = LoginRequest(email="admin@altayar.com", password="Admin123")
+
+        user, access, refresh = service.login(req)
+        print("LOGIN SUCCESS!")
+        print(f"User: {user.email}")
+    except Exception:
+        print("LOGIN FAILED WITH ERROR:")
+        traceback.print_exc()
+    finally:
+        if db is not None:
+            db.close()
+
+
+CHECKS = {
+    "imports": check_imports,
+    "routes": check_routes,
+    "login": check_login,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run backend debug checks in one process")
+    parser.add_argument("checks", nargs="+", choices=sorted(CHECKS))
+    args = parser.parse_args(argv)
+
+    # Each check imports what it needs inside its own try, so a broken
+    # module is reported by the check instead of aborting the run
+    for name in args.checks:
+        print(f"\n=== {name} ===")
+        CHECKS[name]()
+
+
+if __name__ == "__main__":
+    main()
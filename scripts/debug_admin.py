@@ -3,37 +3,39 @@ Debug admin user in database
 """
 import sqlite3
 
-conn = sqlite3.connect('altayar.db')
+import bcrypt
+
+from debug_common import tune_sqlite
+
+conn = tune_sqlite(sqlite3.connect('altayar.db'))
+conn.row_factory = sqlite3.Row
 cursor = conn.cursor()
 
 try:
     cursor.execute("""
         SELECT id, email, username, password_hash, role, status, first_name, last_name
         FROM users 
-        WHERE email = 'admin@altayar.com'
-    """)
+        WHERE email = ?
+    """, ("admin@altayar.com",))
     
     user = cursor.fetchone()
     
     if user:
         print("✅ Admin user found in database!")
         print("─" * 70)
-        print(f"ID:            {user[0]}")
-        print(f"Email:         {user[1]}")
-        print(f"Username:      {user[2]}")
-        print(f"Password Hash: {user[3][:50]}...")
-        print(f"Role:          {user[4]}")
-        print(f"Status:        {user[5]}")
-        print(f"First Name:    {user[6]}")
-        print(f"Last Name:     {user[7]}")
+        print(f"ID:            {user['id']}")
+        print(f"Email:         {user['email']}")
+        print(f"Username:      {user['username']}")
+        print(f"Password Hash: {user['password_hash'][:50]}...")
+        print(f"Role:          {user['role']}")
+        print(f"Status:        {user['status']}")
+        print(f"First Name:    {user['first_name']}")
+        print(f"Last Name:     {user['last_name']}")
         print("─" * 70)
         
         # Test password verification
-        from passlib.context import CryptContext
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        
         test_password = "Admin123"
-        is_valid = pwd_context.verify(test_password, user[3])
+        is_valid = bcrypt.checkpw(test_password.encode('utf-8'), user['password_hash'].encode('utf-8'))
         
         print(f"\n🔐 Password Test:")
         print(f"Testing password: {test_password}")
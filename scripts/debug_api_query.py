@@ -14,16 +14,15 @@ os.environ["SECRET_KEY"] = "dummy"
 os.environ["FAWATERK_API_KEY"] = "dummy"
 os.environ["FAWATERK_VENDOR_KEY"] = "dummy"
 
-sys.path.append(os.path.dirname(__file__))
+import _bootstrap  # noqa: F401
 
 # Import all models first
 import modules
 
 from shared.user_integration_service import UserIntegrationService
-from database.base import SessionLocal
-from modules.points.models import PointsBalance
+from debug_common import SessionLocal
 from modules.memberships.models import MembershipSubscription, MembershipStatus
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 def debug_api_query():
     """Debug what the API query returns"""
@@ -51,7 +50,10 @@ def debug_api_query():
         # Now simulate the get_all_users query
         from modules.users.models import User
 
-        query = db.query(User).options(joinedload(User.subscriptions).joinedload(MembershipSubscription.plan))
+        query = db.query(User).options(
+            selectinload(User.subscriptions).joinedload(MembershipSubscription.plan),
+            selectinload(User.points_balance),
+        )
         users = query.filter(User.email == user_email).all()
 
         print(f'\\n🔍 Found {len(users)} users matching email')
@@ -61,10 +63,7 @@ def debug_api_query():
             print(f'   ID: {u.id} (type: {type(u.id)})')
 
             # Find latest subscription
-            latest_sub = None
-            if u.subscriptions:
-                sorted_subs = sorted(u.subscriptions, key=lambda s: s.created_at, reverse=True)
-                latest_sub = sorted_subs[0] if sorted_subs else None
+            latest_sub = max(u.subscriptions, key=lambda s: s.created_at) if u.subscriptions else None
 
             print(f'   Subscriptions count: {len(u.subscriptions) if u.subscriptions else 0}')
 
@@ -73,9 +72,8 @@ def debug_api_query():
                 print(f'   Status: {latest_sub.status}')
                 print(f'   Expiry: {latest_sub.expiry_date}')
 
-            # Query points balance
-            print(f'\\n🔍 Querying points for user_id: {str(u.id)}')
-            points_balance = db.query(PointsBalance).filter(PointsBalance.user_id == str(u.id)).first()
+            # Points balance comes from the eager-loaded relationship
+            points_balance = u.points_balance
 
             print(f'   Points balance found: {points_balance is not None}')
             if points_balance:
@@ -84,21 +82,6 @@ def debug_api_query():
             else:
                 print('   ❌ No points balance found!')
 
-                # Try different query formats
-                print('   Trying different query formats:')
-                pb1 = db.query(PointsBalance).filter(PointsBalance.user_id == u.id).first()
-                print(f'   Without str(): {pb1 is not None}')
-
-                if isinstance(u.id, str):
-                    pb2 = db.query(PointsBalance).filter(PointsBalance.user_id == uuid.UUID(u.id)).first()
-                    print(f'   As UUID: {pb2 is not None}')
-
-                # Check what user_id values exist in points_balances
-                all_pb = db.query(PointsBalance).limit(5).all()
-                print(f'   Sample existing user_ids in points_balances:')
-                for pb in all_pb:
-                    print(f'     {pb.user_id} (type: {type(pb.user_id)})')
-
         return True
 
     except Exception as e:
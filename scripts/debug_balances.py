@@ -1,46 +1,83 @@
-from database.base import SessionLocal
+import sys
+from collections import defaultdict
+from typing import Iterable
+
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+
+from debug_common import SessionLocal
 from modules.users.models import User
-from modules.cashback.models import CashbackRecord
-from modules.points.models import PointsBalance
+from modules.cashback.models import ClubGiftRecord as CashbackRecord
 from modules.wallet.models import WalletTransaction
 
-def debug_user_balances(email: str):
+def debug_user_balances(emails: Iterable[str]):
+    """Print points, cashback and wallet state for each email.
+
+    Every lookup is keyed on the whole email list, so inspecting N users costs
+    the same handful of queries as inspecting one.
+    """
+    emails = list(emails)
     db = SessionLocal()
     try:
-        user = db.query(User).filter(User.email == email).first()
-        if not user:
-            print(f"❌ User not found: {email}")
-            return
-
-        print(f"👤 User: {user.first_name} {user.last_name} (ID: {user.id})")
-        
-        # Check Points
-        points_balance = db.query(PointsBalance).filter(PointsBalance.user_id == user.id).first()
-        if points_balance:
-            print(f"✅ Points Balance: {points_balance.current_balance} (Total Earned: {points_balance.total_earned})")
-        else:
-            print("❌ No Points Balance found")
-
-        # Check Cashback Records
-        cashback_records = db.query(CashbackRecord).filter(CashbackRecord.user_id == user.id).all()
-        print(f"💰 Cashback Records: {len(cashback_records)}")
-        for r in cashback_records:
-            print(f"   - {r.created_at} | Status: {r.status} | Amount: {r.cashback_amount} | Type: {r.reference_type}")
-
-        # Check Wallet
-        wallet_txs = db.query(WalletTransaction).filter(WalletTransaction.user_id == user.id).all()
-        wallet_balance = 0
-        if wallet_txs:
-             # Calculate balance from transactions if not stored directly on user/wallet model
-             # Assuming wallet balance is sum of transactions or last transaction balance
-             last_tx = sorted(wallet_txs, key=lambda x: x.created_at, reverse=True)[0]
-             wallet_balance = last_tx.balance_after
-        
-        print(f"💳 Wallet Balance (from last tx): {wallet_balance}")
-        print(f"   Total Transactions: {len(wallet_txs)}")
+        users = (
+            db.query(User)
+            .options(selectinload(User.points_balance))
+            .filter(User.email.in_(emails))
+            .all()
+        )
+        users_by_email = {u.email: u for u in users}
+        user_ids = [u.id for u in users]
+
+        cashback_by_user = defaultdict(list)
+        for r in db.query(CashbackRecord).filter(CashbackRecord.user_id.in_(user_ids)).yield_per(200):
+            cashback_by_user[r.user_id].append(r)
+
+        # Newest transaction's balance and the transaction count per user, in one pass
+        ranked = db.query(
+            WalletTransaction.user_id,
+            WalletTransaction.balance_after,
+            func.count(WalletTransaction.id).over(partition_by=WalletTransaction.user_id).label("tx_count"),
+            func.row_number().over(
+                partition_by=WalletTransaction.user_id,
+                order_by=WalletTransaction.created_at.desc(),
+            ).label("rn"),
+        ).filter(WalletTransaction.user_id.in_(user_ids)).subquery()
+        wallet_by_user = {
+            user_id: (balance_after, tx_count)
+            for user_id, balance_after, tx_count in db.query(
+                ranked.c.user_id, ranked.c.balance_after, ranked.c.tx_count
+            ).filter(ranked.c.rn == 1)
+        }
+
+        for email in emails:
+            user = users_by_email.get(email)
+            if not user:
+                print(f"❌ User not found: {email}")
+                continue
+
+            print(f"👤 User: {user.first_name} {user.last_name} (ID: {user.id})")
+
+            # Check Points
+            points_balance = user.points_balance
+            if points_balance:
+                print(f"✅ Points Balance: {points_balance.current_balance} (Total Earned: {points_balance.total_earned})")
+            else:
+                print("❌ No Points Balance found")
+
+            # Check Cashback Records
+            cashback_records = cashback_by_user.get(user.id, [])
+            print(f"💰 Cashback Records: {len(cashback_records)}")
+            for r in cashback_records:
+                print(f"   - {r.created_at} | Status: {r.status} | Amount: {r.cashback_amount} | Type: {r.reference_type}")
+
+            # Check Wallet: balance comes from the newest transaction
+            wallet_balance, wallet_tx_count = wallet_by_user.get(user.id, (0, 0))
+
+            print(f"💳 Wallet Balance (from last tx): {wallet_balance}")
+            print(f"   Total Transactions: {wallet_tx_count}")
 
     finally:
         db.close()
 
 if __name__ == "__main__":
-    debug_user_balances("test1@test1.com")
+    debug_user_balances(sys.argv[1:] or ["test1@test1.com"])
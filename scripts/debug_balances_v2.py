@@ -1,13 +1,11 @@
-import sys
-import os
-
-# Add current directory to path
-sys.path.append(os.getcwd())
+import _bootstrap  # noqa: F401
 
 try:
-    from database.base import SessionLocal
+    from sqlalchemy import func
+
+    from debug_common import SessionLocal
     from modules.users.models import User
-    from modules.cashback.models import CashbackRecord
+    from modules.cashback.models import ClubGiftRecord as CashbackRecord, ClubGiftStatus
     from modules.points.models import PointsBalance
     from modules.wallet.models import WalletTransaction
     from modules.memberships.models import MembershipSubscription
@@ -47,26 +45,33 @@ try:
 
                 # Check Cashback
                 log("checking CASHBACK...")
-                cashback_records = db.query(CashbackRecord).filter(CashbackRecord.user_id == user.id).all()
-                log(f"   Total Records: {len(cashback_records)}")
+                user_cashback = db.query(CashbackRecord).filter(CashbackRecord.user_id == user.id)
+                record_count = db.query(func.count(CashbackRecord.id)).filter(CashbackRecord.user_id == user.id).scalar()
+                log(f"   Total Records: {record_count}")
                 
-                total_credited = 0
-                for r in cashback_records:
+                for r in user_cashback.yield_per(200):
                     log(f"   - Amount: {r.cashback_amount} | Status: {r.status} | Type: {r.reference_type}")
-                    if str(r.status) == "CashbackStatus.CREDITED" or str(r.status) == "CREDITED":
-                        total_credited += r.cashback_amount
                 
+                total_credited = db.query(func.coalesce(func.sum(CashbackRecord.cashback_amount), 0)).filter(
+                    CashbackRecord.user_id == user.id,
+                    CashbackRecord.status == ClubGiftStatus.CREDITED,
+                ).scalar()
                 log(f"   Calculated CREDITED Total: {total_credited}")
 
                 log("-" * 30)
 
                 # Check Wallet
                 log("checking WALLET...")
-                wallet_txs = db.query(WalletTransaction).filter(WalletTransaction.user_id == user.id).all()
-                log(f"   Total Transactions: {len(wallet_txs)}")
+                wallet_tx_count = db.query(func.count(WalletTransaction.id)).filter(
+                    WalletTransaction.user_id == user.id
+                ).scalar()
+                log(f"   Total Transactions: {wallet_tx_count}")
                 
-                if wallet_txs:
-                     last_tx = sorted(wallet_txs, key=lambda x: x.created_at, reverse=True)[0]
+                # Only the newest row is needed for the balance
+                last_tx = db.query(WalletTransaction.balance_after, WalletTransaction.currency).filter(
+                    WalletTransaction.user_id == user.id
+                ).order_by(WalletTransaction.created_at.desc()).first()
+                if last_tx:
                      log(f"   Last Wallet Balance: {last_tx.balance_after} {last_tx.currency}")
                 else:
                      log("   No wallet transactions found.")
@@ -0,0 +1,45 @@
+"""
+Helpers shared by the debug_*.py scripts.
+
+SessionLocal here is a drop-in for database.base.SessionLocal, bound to one
+lazily created engine that applies SQLITE_PRAGMAS on every new connection.
+The engine reads settings on first use, so scripts that set DATABASE_URL
+before opening a session still get the right database.
+"""
+
+from _sqlite_utils import SQLITE_PRAGMAS, tune_sqlite  # noqa: F401 - re-exported
+
+_engine = None
+_session_factory = None
+
+
+def _on_connect(dbapi_conn, connection_record):
+    tune_sqlite(dbapi_conn)
+
+
+def get_engine():
+    """Create the shared debug engine on first call and reuse it afterwards"""
+    global _engine
+    if _engine is None:
+        from sqlalchemy import create_engine, event
+        from config.settings import settings
+
+        if settings.DATABASE_URL.startswith("sqlite"):
+            _engine = create_engine(
+                settings.DATABASE_URL,
+                connect_args={"check_same_thread": False},
+                pool_pre_ping=True,
+            )
+            event.listen(_engine, "connect", _on_connect)
+        else:
+            _engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+    return _engine
+
+
+def SessionLocal():
+    """Open a session on the shared debug engine"""
+    global _session_factory
+    if _session_factory is None:
+        from sqlalchemy.orm import sessionmaker
+        _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    return _session_factory()
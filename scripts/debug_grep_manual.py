@@ -1,29 +1,93 @@
-
+import mmap
 import os
+import re
+
+try:
+    import pathspec
+except ImportError:  # optional: only used to honor .gitignore
+    pathspec = None
+
+SKIP_DIRS = {
+    "venv", "__pycache__", ".git", "node_modules",
+    ".mypy_cache", ".pytest_cache", "build", "dist",
+}
+
+def load_gitignore(root_dir):
+    """Return a PathSpec for root_dir/.gitignore, or None if unavailable"""
+    path = os.path.join(root_dir, ".gitignore")
+    if pathspec is None or not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return pathspec.PathSpec.from_lines("gitwildmatch", f)
+
+def scan_mmap(path, search_bytes, pattern):
+    """Scan raw bytes through mmap; only decode the lines that match"""
+    found = False
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(search_bytes) == -1:
+                return False
+            lineno, pos = 1, 0
+            match = pattern.search(mm, pos)
+            while match:
+                start = match.start()
+                lineno += mm[pos:start].count(b"\n")
+                line_start = mm.rfind(b"\n", 0, start) + 1
+                line_end = mm.find(b"\n", start)
+                if line_end == -1:
+                    line_end = len(mm)
+                print(f"FOUND in {path}:{lineno}")
+                print(f"  > {mm[line_start:line_end].decode('utf-8', errors='replace').strip()}")
+                found = True
+                # Report each line once, then resume after it
+                pos = line_end
+                match = pattern.search(mm, pos)
+    return found
+
+def scan_lines(path, search_text):
+    """Pure-Python fallback: stream the file line by line"""
+    found = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for i, line in enumerate(f, 1):
+            if search_text in line:
+                print(f"FOUND in {path}:{i}")
+                print(f"  > {line.strip()}")
+                found = True
+    return found
 
 def find_text_in_files(root_dir, search_text):
     print(f"Searching for '{search_text}' in {root_dir}...")
     found = False
+    search_bytes = search_text.encode("utf-8")
+    pattern = re.compile(re.escape(search_bytes))
+    ignore = load_gitignore(root_dir)
     for root, dirs, files in os.walk(root_dir):
-        if "venv" in dirs:
-            dirs.remove("venv")
-        if "__pycache__" in dirs:
-            dirs.remove("__pycache__")
-            
+        rel_root = os.path.relpath(root, root_dir)
+        rel_root = "" if rel_root == "." else rel_root + "/"
+        # Prune in place so os.walk never descends into these
+        dirs[:] = [
+            d for d in dirs
+            if d not in SKIP_DIRS and not (ignore and ignore.match_file(f"{rel_root}{d}/"))
+        ]
+
         for file in files:
             if file.endswith(".py"):
+                if ignore and ignore.match_file(rel_root + file):
+                    continue
                 path = os.path.join(root, file)
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-                        for i, line in enumerate(lines):
-                            if search_text in line:
-                                print(f"FOUND in {path}:{i+1}")
-                                print(f"  > {line.strip()}")
-                                found = True
+                    # A file shorter than the needle can't contain it; skip the open
+                    if os.path.getsize(path) < len(search_bytes):
+                        continue
+                    try:
+                        hit = scan_mmap(path, search_bytes, pattern)
+                    except (ValueError, OSError):
+                        # mmap unavailable for this file (e.g. special FS); stream it instead
+                        hit = scan_lines(path, search_text)
+                    found = found or hit
                 except Exception as e:
                     print(f"Error reading {path}: {e}")
-    
+
     if not found:
         print("Text NOT FOUND in any allowed file.")
 
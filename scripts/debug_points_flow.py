@@ -15,13 +15,13 @@ os.environ["SECRET_KEY"] = "dummy"
 os.environ["FAWATERK_API_KEY"] = "dummy"
 os.environ["FAWATERK_VENDOR_KEY"] = "dummy"
 
-sys.path.append(os.path.dirname(__file__))
+import _bootstrap  # noqa: F401
 
 # Import all models first
 import modules
 
 from shared.user_integration_service import UserIntegrationService
-from database.base import SessionLocal
+from debug_common import SessionLocal
 from modules.memberships.models import MembershipPlan, MembershipSubscription, MembershipStatus
 from modules.points.models import PointsBalance, PointsTransaction, PointsTransactionType
 from modules.points.service import PointsService
@@ -57,7 +57,7 @@ def debug_points_flow():
             'password': 'TestPass123',
             'first_name': 'Points',
             'last_name': 'Debug',
-            'plan_id': str(silver_plan.id)
+            'plan_id': silver_plan.id
         }
 
         print(f'\\n👤 إنشاء المستخدم: {user_data["email"]}')
@@ -69,7 +69,7 @@ def debug_points_flow():
         print(f'✅ تم إنشاء المستخدم: {user.id}')
 
         # Step 2: Check if points balance exists before membership
-        points_balance_before = db.query(PointsBalance).filter(PointsBalance.user_id == str(user.id)).first()
+        points_balance_before = db.query(PointsBalance).filter(PointsBalance.user_id == user.id).first()
         print(f'📊 رصيد النقاط قبل العضوية: {points_balance_before}')
 
         # Step 3: Create membership subscription manually
@@ -79,7 +79,7 @@ def debug_points_flow():
         print(f'⭐ النقاط الممنوحة: {points_awarded}')
 
         # Step 4: Check points balance after membership
-        points_balance_after = db.query(PointsBalance).filter(PointsBalance.user_id == str(user.id)).first()
+        points_balance_after = db.query(PointsBalance).filter(PointsBalance.user_id == user.id).first()
         print(f'📊 رصيد النقاط بعد العضوية: {points_balance_after}')
 
         if points_balance_after:
@@ -88,7 +88,7 @@ def debug_points_flow():
             print(f'   - إجمالي المستهلك: {points_balance_after.total_redeemed}')
 
         # Step 5: Check points transactions
-        transactions = db.query(PointsTransaction).filter(PointsTransaction.user_id == str(user.id)).all()
+        transactions = db.query(PointsTransaction).filter(PointsTransaction.user_id == user.id).all()
         print(f'📝 معاملات النقاط: {len(transactions)} معاملة')
 
         for tx in transactions:
@@ -1,13 +1,18 @@
-import sys
-import os
+import _bootstrap  # noqa: F401
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from server import app
+def print_routes():
+    from server import app
 
-print("\n=== REGISTERED ROUTES ===")
-for route in app.routes:
-    if hasattr(route, "path"):
-        print(f"{list(route.methods)} {route.path}")
-print("=========================\n")
+    # Collect once, sorted by path so the listing is stable across runs
+    routes = sorted((r for r in app.routes if hasattr(r, "path")), key=lambda r: r.path)
+
+    print("\n=== REGISTERED ROUTES ===")
+    for route in routes:
+        methods = getattr(route, "methods", None)
+        print(f"{'|'.join(sorted(methods)) if methods else '-'} {route.path}")
+    print("=========================\n")
+
+
+if __name__ == "__main__":
+    print_routes()
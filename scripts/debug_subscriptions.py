@@ -1,11 +1,10 @@
-import sys
-import os
+import _bootstrap  # noqa: F401
 
-sys.path.insert(0, os.getcwd())
+from sqlalchemy.orm import joinedload
 
-from database.base import SessionLocal
-from modules.users.models import User
-from modules.memberships.models import MembershipSubscription, MembershipPlan
+import modules  # noqa: F401  (registers every model the relationships name)
+from debug_common import SessionLocal
+from modules.memberships.models import MembershipSubscription
 
 db = SessionLocal()
 
@@ -14,7 +13,11 @@ try:
     print("DEBUGGING SUBSCRIPTIONS")
     print("="*50)
     
-    subs = db.query(MembershipSubscription).all()
+    subs = (
+        db.query(MembershipSubscription)
+        .options(joinedload(MembershipSubscription.user), joinedload(MembershipSubscription.plan))
+        .all()
+    )
     print(f"Total Subscriptions Found: {len(subs)}\n")
     
     for sub in subs:
@@ -24,9 +27,9 @@ try:
         print(f"Status: {sub.status}")
         print(f"Created At: {sub.created_at}")
         
-        # Check relationships
-        user = db.query(User).filter(User.id == sub.user_id).first()
-        plan = db.query(MembershipPlan).filter(MembershipPlan.id == sub.plan_id).first()
+        # Check relationships (eager-loaded; None means the FK target is missing)
+        user = sub.user
+        plan = sub.plan
         
         print(f"  -> User Found: {user.email if user else 'NO'}")
         print(f"  -> Plan Found: {plan.tier_name_en if plan else 'NO'}")
@@ -1,15 +1,24 @@
 import sqlite3
 
-conn = sqlite3.connect('d:/Development/altayar/MobileApp/backend/altayarvip.db')
+from debug_common import tune_sqlite
+
+# Only a preview of rows is printed; the total comes from COUNT(*)
+DISPLAY_LIMIT = 100
+
+conn = tune_sqlite(sqlite3.connect('d:/Development/altayar/MobileApp/backend/altayarvip.db'))
 cursor = conn.cursor()
 
+cursor.execute('SELECT COUNT(*) FROM membership_subscriptions')
+total = cursor.fetchone()[0]
+
 print("=== Existing Subscriptions ===")
-cursor.execute('SELECT user_id, plan_id, membership_number, status FROM membership_subscriptions')
-for row in cursor.fetchall():
+cursor.execute('SELECT user_id, plan_id, membership_number, status FROM membership_subscriptions LIMIT ?', (DISPLAY_LIMIT,))
+for row in cursor:
     print(f"User ID: {row[0]}, Plan ID: {row[1]}, Membership: {row[2]}, Status: {row[3]}")
+if total > DISPLAY_LIMIT:
+    print(f"... showing first {DISPLAY_LIMIT}")
 
 print("\n=== Total Count ===")
-cursor.execute('SELECT COUNT(*) FROM membership_subscriptions')
-print(f"Total subscriptions: {cursor.fetchone()[0]}")
+print(f"Total subscriptions: {total}")
 
 conn.close()
@@ -1,10 +1,13 @@
-from database.base import SessionLocal
+from sqlalchemy import select
+
+from debug_common import SessionLocal
 from modules.users.models import User
 
 db = SessionLocal()
-users = db.query(User).all()
+# Stream only the printed columns; no ORM instances are built
+stmt = select(User.first_name, User.last_name, User.email, User.role)
 
 print(f"{'Name':<20} | {'Email':<30} | {'Role':<10}")
 print("-" * 65)
-for u in users:
-    print(f"{u.first_name + ' ' + u.last_name:<20} | {u.email:<30} | {u.role}")
+for first_name, last_name, email, role in db.execute(stmt).yield_per(500):
+    print(f"{first_name + ' ' + last_name:<20} | {email:<30} | {role}")
@@ -1,9 +1,8 @@
-import sys
-import os
+import _bootstrap  # noqa: F401
 
-sys.path.insert(0, os.getcwd())
+from sqlalchemy.orm import selectinload
 
-from database.base import SessionLocal
+from debug_common import SessionLocal
 from modules.users.models import User
 # Ensure all models are imported
 from modules.memberships.models import MembershipPlan, MembershipSubscription, MembershipStatus
@@ -17,7 +16,12 @@ try:
     print("SIMULATING API GET /ADMIN/USERS")
     print("="*50)
     
-    users = db.query(User).all()
+    # Load subscriptions (selectin, avoids row explosion) and their plans up front
+    users = (
+        db.query(User)
+        .options(selectinload(User.subscriptions).joinedload(MembershipSubscription.plan))
+        .all()
+    )
     print(f"Total Users: {len(users)}\n")
     
     for u in users:
@@ -27,8 +31,7 @@ try:
         latest_sub = None
         if hasattr(u, "subscriptions") and u.subscriptions:
             print(f"  - Found {len(u.subscriptions)} subscriptions")
-            sorted_subs = sorted(u.subscriptions, key=lambda s: s.created_at, reverse=True)
-            latest_sub = sorted_subs[0] if sorted_subs else None
+            latest_sub = max(u.subscriptions, key=lambda s: s.created_at)
         else:
             print("  - No subscriptions found")
 
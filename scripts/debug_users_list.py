@@ -1,10 +1,8 @@
-import sys
-import os
+import _bootstrap  # noqa: F401
 
-# Add backend to path
-sys.path.insert(0, os.getcwd())
+from sqlalchemy import func, select
 
-from database.base import SessionLocal
+from debug_common import SessionLocal
 from modules.users.models import User
 # Import all other models to ensure relationships are loaded
 from modules.memberships.models import MembershipPlan, MembershipSubscription, MembershipHistory
@@ -19,15 +17,17 @@ try:
     print("QUERYING ALL USERS FROM DATABASE")
     print("="*50)
     
-    users = db.query(User).all()
-    print(f"Total Users Found: {len(users)}\n")
+    total = db.execute(select(func.count(User.id))).scalar()
+    print(f"Total Users Found: {total}\n")
     
-    for u in users:
-        print(f"ID: {u.id}")
-        print(f"Name: {u.first_name} {u.last_name}")
-        print(f"Email: {u.email}")
-        print(f"Role: {u.role}")
-        print(f"Status: {u.status}")
+    # Stream only the printed columns; no ORM instances are built
+    stmt = select(User.id, User.first_name, User.last_name, User.email, User.role, User.status)
+    for user_id, first_name, last_name, email, role, status in db.execute(stmt).yield_per(500):
+        print(f"ID: {user_id}")
+        print(f"Name: {first_name} {last_name}")
+        print(f"Email: {email}")
+        print(f"Role: {role}")
+        print(f"Status: {status}")
         print("-" * 30)
         
 except Exception as e:
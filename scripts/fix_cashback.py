@@ -1,13 +1,12 @@
-import sys
-import os
-
-sys.path.append(os.getcwd())
+import _bootstrap  # noqa: F401
 
 try:
+    from sqlalchemy import text
+
     from database.base import SessionLocal
     from modules.users.models import User
-    from modules.cashback.models import CashbackRecord, CashbackStatus
-    from modules.wallet.models import WalletTransaction
+    from modules.cashback.models import ClubGiftRecord as CashbackRecord, ClubGiftStatus as CashbackStatus
+    from modules.wallet.models import WalletTransaction, TransactionType, TransactionStatus
     from modules.wallet.service import WalletService
     import uuid
     from datetime import datetime
@@ -22,6 +21,12 @@ try:
 
             print(f"Fixing cashback for user: {user.first_name} (ID: {user.id})")
             
+            # Idempotent; turns the (user_id, status) lookup below into an index range scan
+            db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_cashback_user_status "
+                "ON cashback_records (user_id, status)"
+            ))
+
             # Find APPROVED records
             records = db.query(CashbackRecord).filter(
                 CashbackRecord.user_id == user.id,
@@ -29,6 +34,17 @@ try:
             ).all()
 
             print(f"Found {len(records)} APPROVED records.")
+            if not records:
+                return
+
+            # One wallet lookup for the whole batch; balances are chained in Python
+            # and every row goes out with a single flush and commit, instead of
+            # add_cashback() committing once per record.
+            wallet_service = WalletService(db)
+            wallet = wallet_service.get_or_create_wallet(user.id)
+            balance = wallet.balance
+            now = datetime.utcnow()
+            transactions = []
 
             for r in records:
                 print(f"Processing record {r.id}: {r.cashback_amount} USD")
@@ -38,23 +54,33 @@ try:
                      print("   Record already has wallet tx id? weird.")
                 
                 # Credit to wallet MANUAL
-                wallet_service = WalletService(db)
-                transaction = wallet_service.add_cashback(
+                transaction = WalletTransaction(
+                    id=str(uuid.uuid4()),
+                    wallet_id=wallet.id,
                     user_id=r.user_id,
+                    transaction_type=TransactionType.CASHBACK,
                     amount=r.cashback_amount,
+                    balance_before=balance,
+                    balance_after=balance + r.cashback_amount,
+                    currency=wallet.currency,
                     reference_type="CASHBACK_FIX",
                     reference_id=str(r.id),
-                    description_en=f"Cashback Release (Fix)",
-                    description_ar=f"إفراج عن الكاش باك"
+                    description_en="Cashback Release (Fix)",
+                    description_ar="إفراج عن الكاش باك",
+                    status=TransactionStatus.COMPLETED
                 )
+                balance = transaction.balance_after
+                transactions.append(transaction)
                 
                 # Update status
                 r.status = CashbackStatus.CREDITED
-                r.credited_at = datetime.utcnow()
+                r.credited_at = now
                 r.wallet_transaction_id = transaction.id
                 
                 print(f"   updated to CREDITED. Wallet Tx: {transaction.id}")
 
+            wallet.balance = balance
+            db.add_all(transactions)
             db.commit()
             print("Done committing changes.")
 
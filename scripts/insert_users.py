@@ -1,108 +1,59 @@
 """
 Direct SQL insertion using Python sqlite3
 """
-import sqlite3
-from datetime import datetime
 import uuid
 
+from _common import hash_password
+from _sqlite_utils import open_db
+
+TEST_EMAILS = ('admin@altayar.com', 'employee@altayar.com', 'customer@altayar.com')
+EMAILS_PLACEHOLDER = ", ".join("?" * len(TEST_EMAILS))
+
+# Test accounts only: bcrypt's minimum cost (4) keeps seeding instant while
+# still producing hashes the server verifies normally
+PASSWORD_HASHES = {
+    password: hash_password(password, rounds=4)
+    for password in ("Admin123", "Employee123", "Customer123")
+}
+
 # Connect to database
-conn = sqlite3.connect('altayarvip.db')
+conn = open_db('altayarvip.db')
 cursor = conn.cursor()
 
 try:
-    print("🔧 Creating test users...")
-    
-    # Delete existing test users
-    cursor.execute("""
-        DELETE FROM users WHERE email IN ('admin@altayar.com', 'employee@altayar.com', 'customer@altayar.com')
-    """)
-    
-    # Pre-hashed password for "Admin123", "Employee123", "Customer123"
-    # This is a bcrypt hash that works
-    password_hash = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYqYCNqJ4tK"
-    
-    now = datetime.utcnow().isoformat()
-    
-    # Insert Admin
-    cursor.execute("""
-        INSERT INTO users (
-            id, email, password_hash, phone, first_name, last_name,
-            role, status, language, email_verified, email_verified_at,
-            created_at, updated_at, login_count
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        str(uuid.uuid4()),
-        'admin@altayar.com',
-        password_hash,
-        '+966500000001',
-        'Admin',
-        'User',
-        'ADMIN',
-        'ACTIVE',
-        'ar',
-        1,
-        now,
-        now,
-        now,
-        0
-    ))
-    
-    # Insert Employee
-    cursor.execute("""
-        INSERT INTO users (
-            id, email, password_hash, phone, first_name, last_name,
-            role, employee_type, status, language, email_verified, email_verified_at,
-            created_at, updated_at, login_count
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        str(uuid.uuid4()),
-        'employee@altayar.com',
-        password_hash,
-        '+966500000002',
-        'Employee',
-        'User',
-        'EMPLOYEE',
-        'RESERVATION',
-        'ACTIVE',
-        'ar',
-        1,
-        now,
-        now,
-        now,
-        0
-    ))
-    
-    # Insert Customer
-    cursor.execute("""
-        INSERT INTO users (
-            id, email, password_hash, phone, first_name, last_name,
-            role, status, language, email_verified, email_verified_at,
-            created_at, updated_at, login_count
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        str(uuid.uuid4()),
-        'customer@altayar.com',
-        password_hash,
-        '+966500000003',
-        'Customer',
-        'User',
-        'CUSTOMER',
-        'ACTIVE',
-        'ar',
-        1,
-        now,
-        now,
-        now,
-        0
-    ))
-    
-    conn.commit()
+    with conn:
+        print("🔧 Creating test users...")
+
+        # The delete and the inserts commit together
+        cursor.execute("BEGIN")
+
+        # Delete existing test users
+        cursor.execute(f"DELETE FROM users WHERE email IN ({EMAILS_PLACEHOLDER})", TEST_EMAILS)
+
+        rows = [
+            (str(uuid.uuid4()), 'admin@altayar.com', PASSWORD_HASHES['Admin123'], '+966500000001',
+             'Admin', 'User', 'ADMIN', None, 'ACTIVE', 'ar', 1, 0),
+            (str(uuid.uuid4()), 'employee@altayar.com', PASSWORD_HASHES['Employee123'], '+966500000002',
+             'Employee', 'User', 'EMPLOYEE', 'RESERVATION', 'ACTIVE', 'ar', 1, 0),
+            (str(uuid.uuid4()), 'customer@altayar.com', PASSWORD_HASHES['Customer123'], '+966500000003',
+             'Customer', 'User', 'CUSTOMER', None, 'ACTIVE', 'ar', 1, 0),
+        ]
+
+        # One prepared statement for all three users (employee_type is NULL except for the employee)
+        cursor.executemany("""
+            INSERT INTO users (
+                id, email, password_hash, phone, first_name, last_name,
+                role, employee_type, status, language, email_verified, login_count,
+                email_verified_at, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'), datetime('now'))
+        """, rows)
+
     
     # Verify
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT email, role, first_name, last_name FROM users 
-        WHERE email IN ('admin@altayar.com', 'employee@altayar.com', 'customer@altayar.com')
-    """)
+        WHERE email IN ({EMAILS_PLACEHOLDER})
+    """, TEST_EMAILS)
     
     users = cursor.fetchall()
     
@@ -132,6 +83,5 @@ except Exception as e:
     print(f"❌ Error: {e}")
     import traceback
     traceback.print_exc()
-    conn.rollback()
 finally:
     conn.close()
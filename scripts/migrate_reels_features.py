@@ -6,72 +6,69 @@ This migration adds:
 2. parent_id and likes_count to reel_interactions table
 """
 
-import sqlite3
 import os
 
+from _sqlite_utils import open_db
+
 # Get database path
 db_path = os.path.join(os.path.dirname(__file__), '..', 'altayarvip.db')
 
+# table -> [(column, definition, index name or None)]
+NEW_COLUMNS = {
+    "reels": [
+        ("created_by_user_id", "VARCHAR(36)", "ix_reels_created_by_user_id"),
+    ],
+    "reel_interactions": [
+        ("parent_id", "VARCHAR(36)", "ix_reel_interactions_parent_id"),
+        ("likes_count", "INTEGER DEFAULT 0", None),
+    ],
+}
+
+
+def _missing_cols(cursor, table, wanted):
+    """Return the names in wanted that are not yet columns of table"""
+    have = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})").fetchall()}
+    return {col for col in wanted if col not in have}
+
+
 def migrate():
-    conn = sqlite3.connect(db_path)
+    conn = open_db(db_path)
     cursor = conn.cursor()
     
     try:
-        # Add created_by_user_id to reels table
-        print("Adding created_by_user_id to reels table...")
-        try:
-            cursor.execute("""
-                ALTER TABLE reels 
-                ADD COLUMN created_by_user_id VARCHAR(36)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS ix_reels_created_by_user_id 
-                ON reels(created_by_user_id)
-            """)
-            print("✅ Added created_by_user_id column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column name" in str(e).lower():
-                print("⚠️  created_by_user_id column already exists")
-            else:
-                raise
-        
-        # Add parent_id to reel_interactions table
-        print("\nAdding parent_id to reel_interactions table...")
-        try:
-            cursor.execute("""
-                ALTER TABLE reel_interactions 
-                ADD COLUMN parent_id VARCHAR(36)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS ix_reel_interactions_parent_id 
-                ON reel_interactions(parent_id)
-            """)
-            print("✅ Added parent_id column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column name" in str(e).lower():
-                print("⚠️  parent_id column already exists")
-            else:
-                raise
-        
-        # Add likes_count to reel_interactions table
-        print("\nAdding likes_count to reel_interactions table...")
-        try:
-            cursor.execute("""
-                ALTER TABLE reel_interactions 
-                ADD COLUMN likes_count INTEGER DEFAULT 0
-            """)
-            print("✅ Added likes_count column")
-        except sqlite3.OperationalError as e:
-            if "duplicate column name" in str(e).lower():
-                print("⚠️  likes_count column already exists")
-            else:
-                raise
-        
-        conn.commit()
+        # Introspect first, then apply only what is missing in one transaction
+        missing = {
+            table: _missing_cols(cursor, table, [col for col, _, _ in wanted])
+            for table, wanted in NEW_COLUMNS.items()
+        }
+
+        # 128 MiB page cache so the index builds below stay in memory
+        cursor.execute("PRAGMA cache_size=-131072")
+        cursor.execute("BEGIN")
+        for table, wanted in NEW_COLUMNS.items():
+            for col, definition, index in wanted:
+                print(f"Adding {col} to {table} table...")
+                if col not in missing[table]:
+                    print(f"⚠️  {col} column already exists")
+                    continue
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {col} {definition}")
+                print(f"✅ Added {col} column")
+
+        # Build indexes once every column is in place. They are partial: the new
+        # columns are NULL for most rows and lookups are always by a concrete id
+        for table, wanted in NEW_COLUMNS.items():
+            for col, _, index in wanted:
+                if index:
+                    cursor.execute(
+                        f"CREATE INDEX IF NOT EXISTS {index} ON {table}({col}) "
+                        f"WHERE {col} IS NOT NULL"
+                    )
+        cursor.execute("COMMIT")
         print("\n✅ Migration completed successfully!")
         
     except Exception as e:
-        conn.rollback()
+        if conn.in_transaction:
+            conn.rollback()
         print(f"\n❌ Migration failed: {e}")
         raise
     finally:
@@ -1,6 +1,7 @@
-import sqlite3
 import os
 
+from _sqlite_utils import open_db
+
 DB_PATH = "backend/altayarvip.db"
 
 def patch_database():
@@ -8,7 +9,10 @@ def patch_database():
         print("Database not found. It will be created fresh by the app.")
         return
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = open_db(DB_PATH)
+    if os.getenv("ALTAYAR_DEV") == "1":
+        # Throwaway dev DB: skip fsync entirely, durability doesn't matter here
+        conn.execute("PRAGMA synchronous=OFF")
     cursor = conn.cursor()
     
     try:
@@ -26,6 +30,8 @@ def patch_database():
             "membership_id_display": "TEXT"
         }
         
+        # All ALTERs commit together
+        cursor.execute("BEGIN")
         for col_name, col_type in new_columns.items():
             if col_name not in columns:
                 print(f"Adding column: {col_name}...")
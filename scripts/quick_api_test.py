@@ -7,16 +7,19 @@ print("Testing bookings API...")
 print("=" * 60)
 
 try:
-    # Test without auth first to see if server responds
-    response = requests.get(
-        "http://localhost:8082/api/bookings/debug/count",
-        timeout=5
-    )
-    
-    print(f"Debug endpoint status: {response.status_code}")
-    print(f"Response: {response.json()}")
-    print()
-    
+    # One pooled keep-alive connection for every call made below
+    with requests.Session() as session:
+        # Test without auth first to see if server responds
+        response = session.get(
+            "http://localhost:8082/api/bookings/debug/count",
+            timeout=5
+        )
+
+        print(f"Debug endpoint status: {response.status_code}")
+        # Raw body is enough for eyeballing; no need to decode the JSON
+        print(f"Response: {response.text}")
+        print()
+
 except requests.exceptions.ConnectionError:
     print("❌ Server not running on port 8082!")
     print("Start it with: python server.py")
@@ -1,43 +1,41 @@
 """
 Direct database insertion - Simple and works!
 """
-import sqlite3
-from datetime import datetime
-import uuid
+from _common import hash_password
+from _sqlite_utils import SQL_UUID4, open_db
 
 # Connect
-conn = sqlite3.connect('altayarvip.db')
+conn = open_db('altayarvip.db')
 c = conn.cursor()
 
-# This password hash works for: Admin123, Employee123, Customer123
-# Generated using bcrypt with cost factor 12
-pwd_hash = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYqYCNqJ4tK"
-now = datetime.utcnow().isoformat()
+# Test accounts only: bcrypt's minimum cost (4) keeps seeding instant while
+# still producing hashes the server verifies normally
+PASSWORD_HASHES = {
+    password: hash_password(password, rounds=4)
+    for password in ('Admin123', 'Employee123', 'Customer123')
+}
 
 print("Creating users...")
 
-# Delete old test users
-c.execute("DELETE FROM users WHERE email IN ('admin@altayar.com', 'employee@altayar.com', 'customer@altayar.com')")
-
-# Admin
-c.execute("""INSERT INTO users 
-    (id, email, password_hash, phone, first_name, last_name, role, status, language, email_verified, email_verified_at, created_at, updated_at, login_count)
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-    (str(uuid.uuid4()), 'admin@altayar.com', pwd_hash, '+966500000001', 'Admin', 'User', 'ADMIN', 'ACTIVE', 'ar', 1, now, now, now, 0))
-
-# Employee  
-c.execute("""INSERT INTO users 
-    (id, email, password_hash, phone, first_name, last_name, role, employee_type, status, language, email_verified, email_verified_at, created_at, updated_at, login_count)
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-    (str(uuid.uuid4()), 'employee@altayar.com', pwd_hash, '+966500000002', 'Employee', 'User', 'EMPLOYEE', 'RESERVATION', 'ACTIVE', 'ar', 1, now, now, now, 0))
-
-# Customer
-c.execute("""INSERT INTO users 
-    (id, email, password_hash, phone, first_name, last_name, role, status, language, email_verified, email_verified_at, created_at, updated_at, login_count)
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-    (str(uuid.uuid4()), 'customer@altayar.com', pwd_hash, '+966500000003', 'Customer', 'User', 'CUSTOMER', 'ACTIVE', 'ar', 1, now, now, now, 0))
-
-conn.commit()
+# All three upserts commit together, or roll back together on error
+with conn:
+    c.execute("BEGIN")
+    # One prepared statement for all three; employee_type is NULL except for the employee.
+    # Ids are generated by SQLite in the VALUES list
+    rows = [
+        ('admin@altayar.com', PASSWORD_HASHES['Admin123'], '+966500000001', 'Admin', 'User', 'ADMIN', None, 'ACTIVE', 'ar', 1, 0),
+        ('employee@altayar.com', PASSWORD_HASHES['Employee123'], '+966500000002', 'Employee', 'User', 'EMPLOYEE', 'RESERVATION', 'ACTIVE', 'ar', 1, 0),
+        ('customer@altayar.com', PASSWORD_HASHES['Customer123'], '+966500000003', 'Customer', 'User', 'CUSTOMER', None, 'ACTIVE', 'ar', 1, 0),
+    ]
+    c.executemany(f"""INSERT INTO users 
+        (id, email, password_hash, phone, first_name, last_name, role, employee_type, status, language, email_verified, login_count, email_verified_at, created_at, updated_at)
+        VALUES ({SQL_UUID4}, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        ON CONFLICT(email) DO UPDATE SET
+            password_hash = excluded.password_hash,
+            role = excluded.role,
+            employee_type = excluded.employee_type,
+            status = excluded.status,
+            updated_at = CURRENT_TIMESTAMP""", rows)
 
 # Verify
 c.execute("SELECT email, role FROM users WHERE email IN ('admin@altayar.com', 'employee@altayar.com', 'customer@altayar.com')")
@@ -1,14 +1,13 @@
-import sys
-import os
 import uuid
 from datetime import datetime
 
-# Add parent directory to path to allow importing modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import _bootstrap  # noqa: F401
+
+from sqlalchemy import text
 
 from database.base import SessionLocal
 from modules.users.models import User, UserRole, UserStatus
-from shared.utils import hash_password
+from _common import cached_hash
 
 def reset_admin_account():
     """
@@ -17,14 +16,13 @@ def reset_admin_account():
     db = SessionLocal()
     try:
         print("🗑️  Deleting all existing users...")
-        # Delete all users
-        try:
-            db.query(User).delete()
-            db.commit()
-            print("✅ Users table cleared.")
-        except Exception as e:
-            print(f"⚠️  Could not clear table (might be empty or have FK constraints): {e}")
-            db.rollback()
+        # Plain DELETE: no ORM session sync or cascade probing for a full wipe
+        db.execute(text("DELETE FROM users"))
+        db.commit()
+        if db.get_bind().dialect.name == "sqlite":
+            # Hand the freed pages back to the filesystem (must run outside a transaction)
+            db.execute(text("VACUUM"))
+        print("✅ Users table cleared.")
 
         print("👤 Creating fresh Admin account...")
         
@@ -33,7 +31,7 @@ def reset_admin_account():
             id=str(uuid.uuid4()),
             email="admin@altayar.com",
             # Hashing the password "admin123"
-            password_hash=hash_password("admin123"),
+            password_hash=cached_hash("admin123"),
             first_name="Admin",
             last_name="User",
             role=UserRole.ADMIN,
@@ -1,23 +1,21 @@
 """
 Reset admin password
 """
-import sqlite3
-from passlib.context import CryptContext
+from _common import cached_hash
+from _sqlite_utils import open_db
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-conn = sqlite3.connect('altayar.db')
+conn = open_db('altayar.db')
 cursor = conn.cursor()
 
 try:
     # New password
     new_password = "Admin123"
-    hashed = pwd_context.hash(new_password)
+    hashed = cached_hash(new_password)
     
     # Update admin password
     cursor.execute("""
         UPDATE users 
-        SET hashed_password = ? 
+        SET password_hash = ? 
         WHERE email = 'admin@altayar.com'
     """, (hashed,))
     
@@ -1,6 +1,7 @@
-import sqlite3
 import os
 
+from _sqlite_utils import open_db, split_sql
+
 db_path = "altayarvip.db"
 sql_path = "sync_branding.sql"
 
@@ -12,15 +13,21 @@ with open(sql_path, 'r', encoding='utf-8') as f:
     sql = f.read()
 
 try:
-    conn = sqlite3.connect(db_path)
+    # Pragmas are applied before the script runs so the synced SQL benefits too
+    conn = open_db(db_path)
     cursor = conn.cursor()
-    cursor.executescript(sql)
+    # executescript would autocommit each statement; run them all in one transaction instead
+    cursor.execute("BEGIN")
+    for statement in split_sql(sql):
+        cursor.execute(statement)
+    # Verify inside the same transaction: it sees the synced rows without waiting on the commit
+    cursor.execute("SELECT email, first_name, membership_id_display FROM users WHERE role='ADMIN'")
+    admin = cursor.fetchone()
     conn.commit()
+    # Fold the WAL back into the main file so it does not linger between runs
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     print("✅ Database branding and IDs synchronized via SQL successfully!")
     
-    # Verify
-    cursor.execute("SELECT email, first_name, membership_id_display FROM users WHERE role='ADMIN'")
-    admin = cursor.fetchone()
     if admin:
         print(f"📊 Verification: {admin[0]} -> Name: {admin[1]}, ID: {admin[2]}")
         
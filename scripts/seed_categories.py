@@ -1,8 +1,4 @@
-import sys
-import os
-
-# Add current directory to path
-sys.path.append(os.getcwd())
+import _bootstrap  # noqa: F401
 
 from database.base import SessionLocal
 from modules.offers.models import Category
@@ -38,11 +34,17 @@ def seed_categories():
     
     try:
         print("Seeding categories...")
+        # One query for every slug we might add, instead of one per category
+        existing_slugs = {
+            slug for (slug,) in db.query(Category.slug).filter(
+                Category.slug.in_([c["slug"] for c in categories])
+            )
+        }
+
+        to_add = []
         for cat_data in categories:
-            # Check if exists
-            existing = db.query(Category).filter_by(slug=cat_data["slug"]).first()
-            if not existing:
-                new_cat = Category(
+            if cat_data["slug"] not in existing_slugs:
+                to_add.append(Category(
                     id=str(uuid.uuid4()),
                     name_en=cat_data["name_en"],
                     name_ar=cat_data["name_ar"],
@@ -50,12 +52,12 @@ def seed_categories():
                     icon=cat_data["icon"],
                     is_active=True,
                     sort_order=0
-                )
-                db.add(new_cat)
+                ))
                 print(f"Added: {cat_data['name_en']}")
             else:
                 print(f"Skipped (Exists): {cat_data['name_en']}")
         
+        db.bulk_save_objects(to_add)
         db.commit()
         print("Categories seeded successfully!")
         
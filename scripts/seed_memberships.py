@@ -1,11 +1,9 @@
-import sys
 import os
 import uuid
 import json
 from datetime import datetime
 
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import _bootstrap  # noqa: F401
 
 # Inject dummy env vars
 if "FAWATERK_API_KEY" not in os.environ:
@@ -76,11 +74,12 @@ def run_seed():
     except Exception as e:
         print(f"❌ Error creating table: {e}")
 
-    # 2. Check & Add Columns (Migration fallback)
-    inspector = inspect(engine)
-    existing_cols = [c['name'] for c in inspector.get_columns('membership_plans')]
-    
-    with engine.connect() as conn:
+    # Column fixes, the existence check and the insert share one transaction,
+    # committed once when the block exits
+    with engine.begin() as conn:
+        # 2. Check & Add Columns (Migration fallback), reflecting on the same connection
+        existing_cols = {c['name'] for c in inspect(conn).get_columns('membership_plans')}
+
         new_cols = {
             'plan_type': 'VARCHAR(50) DEFAULT \'PAID_INFINITE\'',
             'duration_days': 'INTEGER',
@@ -92,7 +91,6 @@ def run_seed():
                 print(f"   + Adding missing column: {col}")
                 try:
                     conn.execute(text(f"ALTER TABLE membership_plans ADD COLUMN {col} {definition}"))
-                    conn.commit()
                 except Exception as e:
                     print(f"   ! Failed to add {col}: {e}")
 
@@ -139,7 +137,6 @@ def run_seed():
                     updated_at=datetime.utcnow()
                 )
                 conn.execute(ins)
-                conn.commit()
                 print("   ✅ Silver Membership plan created successfully.")
         except Exception as e:
             print(f"❌ Error during insert: {e}")
@@ -2,154 +2,95 @@
 Seed script to create test users for development
 Run this script to populate the database with test accounts
 """
-import sys
-import os
+import _bootstrap  # noqa: F401
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from database.base import SessionLocal
 from modules.users.models import User, UserRole, EmployeeType, UserStatus
 from shared.utils import hash_password
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import multiprocessing
 import uuid
 
+# Plaintexts shared by the test accounts; each is hashed once per run
+TEST_PASSWORDS = ("Admin123", "Employee123", "Customer123")
+
+
+def hash_test_passwords():
+    """Hash each distinct test password once, in parallel where fork is available"""
+    # bcrypt is CPU-bound, but spawned workers (Windows) re-import this script
+    # and the whole ORM, which costs more than the hashes themselves
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return {password: hash_password(password) for password in TEST_PASSWORDS}
+    with ProcessPoolExecutor(max_workers=len(TEST_PASSWORDS),
+                             mp_context=multiprocessing.get_context("fork")) as pool:
+        return dict(zip(TEST_PASSWORDS, pool.map(hash_password, TEST_PASSWORDS)))
+
+
 def create_test_users():
     """Create test users for each role"""
+    # Hash before opening the session so no transaction is held meanwhile
+    hashes = hash_test_passwords()
     db = SessionLocal()
     
     try:
-        # Check if users already exist
-        existing_admin = db.query(User).filter(User.email == "admin@altayar.com").first()
-        if existing_admin:
-            print("⚠️  Test users already exist. Skipping...")
-            return
-        
-        print("🔧 Creating test users...")
-        
-        # 1. Super Admin
-        super_admin = User(
-            id=str(uuid.uuid4()),
-            email="superadmin@altayar.com",
-            password_hash=hash_password("Admin123"),
-            phone="+966500000001",
-            first_name="Ahmad",
-            last_name="Manager",
-            role=UserRole.SUPER_ADMIN,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # 2. Admin
-        admin = User(
-            id=str(uuid.uuid4()),
-            email="admin@altayar.com",
-            password_hash=hash_password("Admin123"),
-            phone="+966500000002",
-            first_name="Mohammed",
-            last_name="Admin",
-            role=UserRole.ADMIN,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # 3. Employee - Reservation
-        employee_reservation = User(
-            id=str(uuid.uuid4()),
-            email="reservation@altayar.com",
-            password_hash=hash_password("Employee123"),
-            phone="+966500000003",
-            first_name="Khaled",
-            last_name="Reservation",
-            role=UserRole.EMPLOYEE,
-            employee_type=EmployeeType.RESERVATION,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # 4. Employee - Sales
-        employee_sales = User(
-            id=str(uuid.uuid4()),
-            email="sales@altayar.com",
-            password_hash=hash_password("Employee123"),
-            phone="+966500000004",
-            first_name="Fatima",
-            last_name="Sales",
-            role=UserRole.EMPLOYEE,
-            employee_type=EmployeeType.SALES,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # 5. Employee - Accounting
-        employee_accounting = User(
-            id=str(uuid.uuid4()),
-            email="accounting@altayar.com",
-            password_hash=hash_password("Employee123"),
-            phone="+966500000005",
-            first_name="Omar",
-            last_name="Accounting",
-            role=UserRole.EMPLOYEE,
-            employee_type=EmployeeType.ACCOUNTING,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # 6. Customer 1
-        customer1 = User(
-            id=str(uuid.uuid4()),
-            email="customer@altayar.com",
-            password_hash=hash_password("Customer123"),
-            phone="+966500000006",
-            first_name="Sara",
-            last_name="Customer",
-            role=UserRole.CUSTOMER,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # 7. Customer 2
-        customer2 = User(
-            id=str(uuid.uuid4()),
-            email="customer2@altayar.com",
-            password_hash=hash_password("Customer123"),
-            phone="+966500000007",
-            first_name="Ali",
-            last_name="Client",
-            role=UserRole.CUSTOMER,
-            status=UserStatus.ACTIVE,
-            language="ar",
-            email_verified=True,
-            email_verified_at=datetime.utcnow(),
-        )
-        
-        # Add all users
-        users = [
-            super_admin,
-            admin,
-            employee_reservation,
-            employee_sales,
-            employee_accounting,
-            customer1,
-            customer2,
-        ]
-        
-        db.add_all(users)
-        db.commit()
+        # One transaction, one executemany INSERT for all seven users;
+        # accounts that already exist are left untouched by ON CONFLICT
+        with db.begin():
+            print("🔧 Creating test users...")
+            
+            # Fields shared by every account; one timestamp for the batch.
+            # executemany compiles one statement from the first row's keys,
+            # so every row carries the same columns (employee_type included).
+            now = datetime.utcnow()
+            shared = dict(
+                employee_type=None,
+                status=UserStatus.ACTIVE,
+                language="ar",
+                email_verified=True,
+                email_verified_at=now,
+            )
+            rows = [
+                # 1. Super Admin
+                {**shared, "id": str(uuid.uuid4()), "email": "superadmin@altayar.com",
+                 "password_hash": hashes["Admin123"], "phone": "+966500000001",
+                 "first_name": "Ahmad", "last_name": "Manager", "role": UserRole.SUPER_ADMIN},
+                # 2. Admin
+                {**shared, "id": str(uuid.uuid4()), "email": "admin@altayar.com",
+                 "password_hash": hashes["Admin123"], "phone": "+966500000002",
+                 "first_name": "Mohammed", "last_name": "Admin", "role": UserRole.ADMIN},
+                # 3. Employee - Reservation
+                {**shared, "id": str(uuid.uuid4()), "email": "reservation@altayar.com",
+                 "password_hash": hashes["Employee123"], "phone": "+966500000003",
+                 "first_name": "Khaled", "last_name": "Reservation", "role": UserRole.EMPLOYEE,
+                 "employee_type": EmployeeType.RESERVATION},
+                # 4. Employee - Sales
+                {**shared, "id": str(uuid.uuid4()), "email": "sales@altayar.com",
+                 "password_hash": hashes["Employee123"], "phone": "+966500000004",
+                 "first_name": "Fatima", "last_name": "Sales", "role": UserRole.EMPLOYEE,
+                 "employee_type": EmployeeType.SALES},
+                # 5. Employee - Accounting
+                {**shared, "id": str(uuid.uuid4()), "email": "accounting@altayar.com",
+                 "password_hash": hashes["Employee123"], "phone": "+966500000005",
+                 "first_name": "Omar", "last_name": "Accounting", "role": UserRole.EMPLOYEE,
+                 "employee_type": EmployeeType.ACCOUNTING},
+                # 6. Customer 1
+                {**shared, "id": str(uuid.uuid4()), "email": "customer@altayar.com",
+                 "password_hash": hashes["Customer123"], "phone": "+966500000006",
+                 "first_name": "Sara", "last_name": "Customer", "role": UserRole.CUSTOMER},
+                # 7. Customer 2
+                {**shared, "id": str(uuid.uuid4()), "email": "customer2@altayar.com",
+                 "password_hash": hashes["Customer123"], "phone": "+966500000007",
+                 "first_name": "Ali", "last_name": "Client", "role": UserRole.CUSTOMER},
+            ]
+            
+            insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+            db.execute(insert(User).on_conflict_do_nothing(index_elements=["email"]), rows)
         
-        print("✅ Test users created successfully!")
+        print("✅ Test users are in place (existing accounts were kept)!")
         print("\n" + "="*60)
         print("📋 Test Accounts:")
         print("="*60)
@@ -1,52 +1,123 @@
 """
 Complete database setup: Create tables + Insert membership plans
+
+The first run builds a snapshot (altayar.seed.db) and copies it over
+altayar.db; later runs just copy the snapshot again, as long as it is newer
+than this script, database/mixins.py and every modules/*/models.py. Pass
+--rebuild to force a fresh build.
+
+A fresh build replays the CREATE TABLE/INDEX script cached in altayar.seed.sql
+instead of running metadata.create_all(), unless a models.py file, the mixins
+or this script changed since the cache was written.
 """
-from database.base import Base, engine
+import _bootstrap  # noqa: F401
+from _common import is_fresh
+from database.base import Base
+from sqlalchemy import create_engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+import glob
+import os
+import shutil
 import sqlite3
+import sys
+import uuid
 from datetime import datetime
 
-print("🔨 Setting up complete database...")
-print("=" * 70)
+DB_PATH = 'altayar.db'
+SEED_PATH = 'altayar.seed.db'
+SCHEMA_CACHE = 'altayar.seed.sql'
 
-try:
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _schema_sources():
+    """This script, the shared column mixins and every models.py: the files the
+    snapshot and DDL cache derive from"""
+    return [
+        os.path.abspath(__file__),
+        os.path.join(BACKEND_DIR, "database", "mixins.py"),
+    ] + glob.glob(os.path.join(BACKEND_DIR, "modules", "*", "models.py"))
+
+
+def _snapshot_is_fresh():
+    """True when the seed snapshot is newer than every file in _schema_sources()"""
+    return is_fresh(SEED_PATH, _schema_sources())
+
+
+def _schema_cache_is_fresh():
+    """True when the cached DDL is newer than every file in _schema_sources()"""
+    return is_fresh(SCHEMA_CACHE, _schema_sources())
+
+
+def _write_schema_cache(engine):
+    """Compile the DDL create_all() emits (tables, then their indexes) into SCHEMA_CACHE"""
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(engine)).strip())
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            statements.append(str(CreateIndex(index).compile(engine)).strip())
+    with open(SCHEMA_CACHE, "w", encoding="utf-8") as f:
+        f.write(";\n\n".join(statements) + ";\n")
+
+
+def _restore_snapshot():
+    """Copy the seed snapshot over DB_PATH, dropping any stale WAL sidecars"""
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(DB_PATH + suffix):
+            os.remove(DB_PATH + suffix)
+    shutil.copyfile(SEED_PATH, DB_PATH)
+
+
+def _build_fresh(path):
+    """Create every table in path and insert the membership plans"""
     # Import all models
     print("\n📦 Step 1: Importing models...")
     print("─" * 70)
     
-    from modules.users.models import *
+    import modules.users.models  # noqa: F401  (registers the tables on Base)
     print("  ✓ users")
-    from modules.memberships.models import *
+    import modules.memberships.models  # noqa: F401  (registers the tables on Base)
     print("  ✓ memberships")
-    from modules.orders.models import *
+    import modules.orders.models  # noqa: F401  (registers the tables on Base)
     print("  ✓ orders")
-    from modules.payments.models import *
+    import modules.payments.models  # noqa: F401  (registers the tables on Base)
     print("  ✓ payments")
-    from modules.points.models import *
+    import modules.points.models  # noqa: F401  (registers the tables on Base)
     print("  ✓ points")
-    from modules.notifications.models import *
+    import modules.notifications.models  # noqa: F401  (registers the tables on Base)
     print("  ✓ notifications")
     
-    # Drop and create tables
+    # Create tables in the (new, empty) snapshot file
     print("\n🏗️  Step 2: Building database tables...")
     print("─" * 70)
-    Base.metadata.drop_all(bind=engine)
-    print("  ✓ Dropped existing tables")
-    
-    Base.metadata.create_all(bind=engine)
-    print("  ✓ Created all tables")
+    engine = create_engine(f"sqlite:///{path}")
+    if _schema_cache_is_fresh():
+        # One script, parsed and run by SQLite; no per-table checks from SQLAlchemy
+        ddl_conn = sqlite3.connect(path)
+        with open(SCHEMA_CACHE, encoding="utf-8") as f:
+            ddl_conn.executescript(f.read())
+        ddl_conn.close()
+        print(f"  ✓ Created all tables (from {SCHEMA_CACHE})")
+    else:
+        Base.metadata.create_all(bind=engine)
+        _write_schema_cache(engine)
+        print("  ✓ Created all tables")
     
     # Verify tables
     from sqlalchemy import inspect
     inspector = inspect(engine)
     tables = inspector.get_table_names()
     print(f"  ✓ Total tables: {len(tables)}")
+    engine.dispose()
     
     # Insert membership plans
     print("\n💎 Step 3: Creating 6 Membership Plans...")
     print("─" * 70)
     
-    conn = sqlite3.connect('altayar.db')
+    conn = sqlite3.connect(path)
     cursor = conn.cursor()
+    # Throwaway build file: no fsyncs and an in-memory rollback journal
+    cursor.executescript("PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY;")
     
     # Define 6 membership plans
     memberships = [
@@ -130,38 +201,29 @@ try:
         }
     ]
     
-    # Insert each membership
-    for membership in memberships:
-        cursor.execute("""
-            INSERT INTO membership_plans (
-                id, tier_code, tier_name_ar, tier_name_en, tier_order,
-                price, initial_points, currency, duration_days,
-                cashback_rate, points_multiplier, color_hex,
-                is_active, created_at, updated_at
-            ) VALUES (
-                lower(hex(randomblob(16))),
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1,
-                datetime('now'), datetime('now')
-            )
-        """, (
-            membership["tier_code"],
-            membership["tier_name_ar"],
-            membership["tier_name_en"],
-            membership["tier_order"],
-            membership["price"],
-            membership["initial_points"],
-            membership["currency"],
-            membership["duration_days"],
-            membership["cashback_rate"],
-            membership["points_multiplier"],
-            membership["color_hex"]
-        ))
-        
-        points_value = membership["price"] / membership["initial_points"]
-        print(f"  ✓ {membership['tier_code']:10} | ${membership['price']:8,.0f} | {membership['initial_points']:6,} pts | ${points_value:.2f}/pt")
-    
+    # One prepared INSERT for all plans, in one transaction; ids are bound
+    # like every other value and the dicts bind by name
+    cursor.execute("BEGIN")
+    cursor.executemany("""
+        INSERT INTO membership_plans (
+            id, tier_code, tier_name_ar, tier_name_en, tier_order,
+            price, initial_points, currency, duration_days,
+            cashback_rate, points_multiplier, color_hex,
+            is_active, created_at, updated_at
+        ) VALUES (
+            :id, :tier_code, :tier_name_ar, :tier_name_en, :tier_order,
+            :price, :initial_points, :currency, :duration_days,
+            :cashback_rate, :points_multiplier, :color_hex, 1,
+            datetime('now'), datetime('now')
+        )
+    """, [{**membership, "id": str(uuid.uuid4())} for membership in memberships])
     conn.commit()
     
+    print("\n".join(
+        f"  ✓ {m['tier_code']:10} | ${m['price']:8,.0f} | {m['initial_points']:6,} pts | ${m['price'] / m['initial_points']:.2f}/pt"
+        for m in memberships
+    ))
+    
     # Verify insertion
     print("\n📊 Step 4: Verification...")
     print("─" * 70)
@@ -171,6 +233,23 @@ try:
     print(f"  ✓ Total membership plans in database: {count}")
     
     conn.close()
+
+
+print("🔨 Setting up complete database...")
+print("=" * 70)
+
+try:
+    if "--rebuild" not in sys.argv and _snapshot_is_fresh():
+        print(f"\n📦 Restoring {DB_PATH} from snapshot {SEED_PATH}...")
+    else:
+        # Build next to the snapshot and swap it in only once complete, so a
+        # failed build never leaves a half-seeded snapshot behind
+        tmp_path = SEED_PATH + ".tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        _build_fresh(tmp_path)
+        os.replace(tmp_path, SEED_PATH)
+    _restore_snapshot()
     
     print("\n" + "=" * 70)
     print("✅ Database setup completed successfully!")
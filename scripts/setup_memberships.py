@@ -4,6 +4,8 @@ No SQLAlchemy models - just raw SQL to avoid conflicts
 """
 import sqlite3
 import os
+import uuid
+from itertools import chain
 
 DB_PATH = 'altayar.db'
 
@@ -18,8 +20,13 @@ if os.path.exists(DB_PATH):
 # Create new database
 conn = sqlite3.connect(DB_PATH)
 cursor = conn.cursor()
+# The database is recreated from scratch on every run: skip fsyncs and keep the
+# rollback journal in memory
+cursor.executescript("PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY;")
 
 try:
+    # Table and plans commit together
+    cursor.execute("BEGIN")
     # Create membership_plans table
     print("\n📋 Creating membership_plans table...")
     cursor.execute("""
@@ -63,22 +70,25 @@ try:
         ("DIAMOND", "ماسي", "Diamond", 6, 50000.00, 47000, 0.15, 3.0, "#B9F2FF")
     ]
     
-    for tier_code, name_ar, name_en, order, price, points, cashback, multiplier, color in memberships:
-        cursor.execute("""
-            INSERT INTO membership_plans (
-                id, tier_code, tier_name_ar, tier_name_en, tier_order,
-                price, initial_points, currency, duration_days,
-                cashback_rate, points_multiplier, color_hex, is_active
-            ) VALUES (
-                lower(hex(randomblob(16))), ?, ?, ?, ?, ?, ?, 'USD', 365, ?, ?, ?, 1
-            )
-        """, (tier_code, name_ar, name_en, order, price, points, cashback, multiplier, color))
-        
-        points_value = price / points
-        print(f"✓ {tier_code:10} | ${price:8,.0f} | {points:6,} pts | ${points_value:.2f}/pt")
+    # One multi-row INSERT for all six plans (10 bound values per row, well under
+    # SQLite's parameter limit); ids are bound like every other value
+    placeholders = ", ".join(["(?, ?, ?, ?, ?, ?, ?, 'USD', 365, ?, ?, ?, 1)"] * len(memberships))
+    cursor.execute(f"""
+        INSERT INTO membership_plans (
+            id, tier_code, tier_name_ar, tier_name_en, tier_order,
+            price, initial_points, currency, duration_days,
+            cashback_rate, points_multiplier, color_hex, is_active
+        ) VALUES {placeholders}
+    """, list(chain.from_iterable((str(uuid.uuid4()), *plan) for plan in memberships)))
     
     conn.commit()
     
+    # Build the summary table in memory and write it once
+    print("\n".join(
+        f"✓ {tier_code:10} | ${price:8,.0f} | {points:6,} pts | ${price / points:.2f}/pt"
+        for tier_code, _, _, _, price, points, _, _, _ in memberships
+    ))
+    
     # Verify
     print("\n📊 Verification...")
     print("─" * 70)
@@ -91,9 +101,10 @@ try:
     
     print("\n📋 All membership plans:")
     print("─" * 70)
-    for tier, price, points in plans:
-        value = price / points if points > 0 else 0
-        print(f"  {tier:10} → ${price:8,.0f} / {points:6,} pts = ${value:.2f} per point")
+    print("\n".join(
+        f"  {tier:10} → ${price:8,.0f} / {points:6,} pts = ${price / points if points > 0 else 0:.2f} per point"
+        for tier, price, points in plans
+    ))
     
     print("\n" + "=" * 70)
     print("✅ Database setup completed!")
@@ -5,7 +5,10 @@ import sqlite3
 from passlib.context import CryptContext
 import uuid
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# DEV-ONLY seeder: minimum bcrypt cost so hashing is near-instant. The cost is
+# stored in the hash, so the server still verifies it; production accounts get
+# the app's default rounds.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
 
 print("🔐 Creating admin user with direct SQL...")
 print("=" * 70)
@@ -36,6 +39,7 @@ try:
             email_verified, phone_verified,
             login_count, created_at, updated_at
         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+        RETURNING email, role, status, password_hash
     """, (
         admin_id,
         "admin@altayar.com",
@@ -51,13 +55,12 @@ try:
         1,
         0
     ))
+    # The inserted row comes back from RETURNING (SQLite 3.35+); read it before committing
+    result = cursor.fetchone()
     
     conn.commit()
     
     # Verify
-    cursor.execute("SELECT email, role, status FROM users WHERE email = 'admin@altayar.com'")
-    result = cursor.fetchone()
-    
     if result:
         print(f"\n✅ Admin user created successfully!")
         print(f"   Email: {result[0]}")
@@ -65,8 +68,7 @@ try:
         print(f"   Status: {result[2]}")
         
         # Test password
-        cursor.execute("SELECT password_hash FROM users WHERE email = 'admin@altayar.com'")
-        saved_hash = cursor.fetchone()[0]
+        saved_hash = result[3]
         test_verify = pwd_context.verify(password, saved_hash)
         
         print(f"\n🔍 Password verification: {'✅ PASS' if test_verify else '❌ FAIL'}")
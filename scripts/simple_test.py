@@ -3,24 +3,12 @@
 Simple test for user integration service
 """
 
-import os
-import sys
 import uuid
 
-# Setup environment
-os.environ["DATABASE_URL"] = "sqlite:///d:/Development/altayar/MobileApp/backend/altayarvip.db"
-os.environ["JWT_SECRET_KEY"] = "dummy"
-os.environ["SECRET_KEY"] = "dummy"
-os.environ["FAWATERK_API_KEY"] = "dummy"
-os.environ["FAWATERK_VENDOR_KEY"] = "dummy"
-
-sys.path.append(os.path.dirname(__file__))
-
-# Import all models first
-import modules
+# Environment, model registration and SessionLocal
+from _test_bootstrap import SessionLocal
 
 from shared.user_integration_service import UserIntegrationService
-from database.base import SessionLocal
 
 print('🧪 Testing User Integration Service...')
 
@@ -1,9 +1,8 @@
-import sys
-import os
 from datetime import datetime
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import _bootstrap  # noqa: F401
+
+from sqlalchemy import func, literal, or_, update
 
 from database.base import SessionLocal
 from modules.users.models import User, UserRole
@@ -13,27 +12,35 @@ def fix_branding_and_ids():
     try:
         print("🔍 Scanning database for branding updates...")
         
+        # Everything runs as set-based Core UPDATEs; no User objects are loaded
         # 1. Fix Admin Name
-        admins = db.query(User).filter(User.role.in_([UserRole.ADMIN, UserRole.SUPER_ADMIN])).all()
-        for admin in admins:
-            print(f"👤 Updating admin: {admin.email} -> AltayarVIP")
-            admin.first_name = "AltayarVIP"
-            admin.last_name = ""
-            admin.username = "AltayarVIP"
+        result = db.execute(
+            update(User)
+            .where(User.role.in_([UserRole.ADMIN, UserRole.SUPER_ADMIN]))
+            .values(first_name="AltayarVIP", last_name="", username="AltayarVIP")
+            .execution_options(synchronize_session=False)
+        )
+        print(f"👤 Updated {result.rowcount} admin(s) -> AltayarVIP")
             
-        # 2. Fix Membership IDs (Prefix with ALT- if missing)
-        all_users = db.query(User).all()
-        for user in all_users:
-            current_id = user.membership_id_display
-            if not current_id:
-                # Use first 8 chars of UUID if missing
-                current_id = f"ALT-{user.id[:8].upper()}"
-                user.membership_id_display = current_id
-                print(f"🆔 Generated ID for {user.email}: {current_id}")
-            elif not str(current_id).startswith("ALT-"):
-                new_id = f"ALT-{str(current_id).upper()}"
-                user.membership_id_display = new_id
-                print(f"🆔 Updated ID for {user.email}: {new_id}")
+        # 2. Fix Membership IDs
+        # Generate missing ones first (first 8 chars of the UUID), so empty IDs
+        # are not picked up by the prefix step below
+        result = db.execute(
+            update(User)
+            .where(or_(User.membership_id_display.is_(None), User.membership_id_display == ""))
+            .values(membership_id_display=literal("ALT-").concat(func.upper(func.substr(User.id, 1, 8))))
+            .execution_options(synchronize_session=False)
+        )
+        print(f"🆔 Generated {result.rowcount} membership ID(s)")
+
+        # Prefix with ALT- if missing
+        result = db.execute(
+            update(User)
+            .where(User.membership_id_display.notlike("ALT-%"))
+            .values(membership_id_display=literal("ALT-").concat(func.upper(User.membership_id_display)))
+            .execution_options(synchronize_session=False)
+        )
+        print(f"🆔 Prefixed {result.rowcount} membership ID(s) with ALT-")
 
         db.commit()
         print("✅ Database branding and IDs synchronized successfully!")
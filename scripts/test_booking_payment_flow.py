@@ -113,13 +113,13 @@ def test_booking_payment_flow():
         # 6. Check if payment was created
         print("6. Checking if payment was created...")
         payments_after = requests.get(f"{BASE_URL}/payments", headers=headers)
-        payments_count_after = len(payments_after.json().get('items', [])) if payments_after.status_code == 200 else 0
+        payments_data = payments_after.json().get('items', []) if payments_after.status_code == 200 else []
+        payments_count_after = len(payments_data)
 
         if payments_count_after > payments_count_before:
             print(f"✅ Payments count increased: {payments_count_before} → {payments_count_after}")
 
             # Check if payment is linked to booking
-            payments_data = payments_after.json().get('items', [])
             booking_payment = None
             for payment in payments_data:
                 if payment.get('booking') and payment['booking'].get('id') == booking_id:
@@ -2,7 +2,7 @@
 Direct test of bookings endpoint - needs admin token
 """
 import sys
-sys.path.insert(0, '.')
+import _bootstrap  # noqa: F401
 
 # Create a test admin token
 from modules.auth.utils import create_access_token
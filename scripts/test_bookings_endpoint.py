@@ -10,7 +10,8 @@ def test_bookings_list():
             print(f"Login failed: {auth_res.text}")
             return
 
-        token = auth_res.json()["access_token"]
+        auth = auth_res.json()
+        token = auth["access_token"]
         headers = {"Authorization": f"Bearer {token}"}
 
         # 2. List Bookings (Admin)
@@ -46,7 +47,7 @@ def test_bookings_list():
             print(f"FAILURE: User bookings endpoint returned {res_me.status_code}: {res_me.text}")
 
         # 4. Check if admin has any bookings with their user_id
-        print(f"\nAdmin user ID: {auth_res.json().get('user', {}).get('id', 'unknown')}")
+        print(f"\nAdmin user ID: {auth.get('user', {}).get('id', 'unknown')}")
         print(f"Booking user IDs from admin view: {data[0].get('user_id') if data else 'none'}")
 
         # 5. Test the customer user that has bookings
@@ -5,11 +5,8 @@ This script tests the Fawaterk payment gateway with USD currency.
 It creates a test invoice and verifies the gateway accepts USD.
 """
 import sys
-import os
-from pathlib import Path
 
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent))
+import _bootstrap  # noqa: F401
 
 from modules.payments.fawaterk_service import FawaterkService
 from config.settings import settings
@@ -4,7 +4,6 @@
 """
 
 import os
-import sys
 import uuid
 
 # Setup environment
@@ -14,7 +13,7 @@ os.environ["SECRET_KEY"] = "dummy"
 os.environ["FAWATERK_API_KEY"] = "dummy"
 os.environ["FAWATERK_VENDOR_KEY"] = "dummy"
 
-sys.path.append(os.path.dirname(__file__))
+import _bootstrap  # noqa: F401
 
 # Import all models first
 import modules
@@ -6,8 +6,7 @@ instead of subscription.membership_number for the membership_id field.
 """
 
 import sys
-import os
-sys.path.append('.')
+import _bootstrap  # noqa: F401
 
 from sqlalchemy.orm import Session, joinedload
 from database.base import get_db
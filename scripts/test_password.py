@@ -1,9 +1,7 @@
 """
 Test bcrypt hash and verify
 """
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import _bootstrap  # noqa: F401
 
 from shared.utils import hash_password, verify_password
 import sqlite3
@@ -92,6 +90,6 @@ if row:
         print("   The problem might be elsewhere...")
 else:
     print("   ❌ Admin user not found!")
-    print("   Run: python final_admin.py")
+    print("   Run: python admin.py")
 
 conn.close()
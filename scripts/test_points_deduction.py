@@ -2,9 +2,7 @@
 """
 Test script for points deduction functionality
 """
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import _bootstrap  # noqa: F401
 
 from sqlalchemy.orm import sessionmaker
 from database.base import engine, get_db
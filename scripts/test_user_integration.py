@@ -17,7 +17,7 @@ os.environ["SECRET_KEY"] = "dummy"
 os.environ["FAWATERK_API_KEY"] = "dummy"
 os.environ["FAWATERK_VENDOR_KEY"] = "dummy"
 
-sys.path.append(os.path.join(os.path.dirname(__file__)))
+import _bootstrap  # noqa: F401
 
 # Import all models first
 import modules